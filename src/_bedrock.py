@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""
+Shared Bedrock model factory for the Strands agent scripts in this directory.
+
+Agents that run tools concurrently issue several Bedrock calls at once, so the
+boto3 client is configured with a larger connection pool than botocore's
+default of 10 and with TCP keep-alive, so sockets are reused between calls.
+
+Usage:
+  from _bedrock import get_shared_bedrock_model
+  model = get_shared_bedrock_model('us-west-2', 'us.amazon.nova-lite-v1:0')
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_shared_bedrock_model(region: str, model_id: str, temperature: float = 0.3, max_tokens: int = 2048):
+    """
+    Return a BedrockModel for region and model_id, creating it on first use.
+
+    Args:
+        region: AWS region for the Bedrock runtime client
+        model_id: Bedrock model ID or inference profile
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens to generate per response
+
+    Returns:
+        BedrockModel: Model shared by every caller with the same arguments
+    """
+    # Imported lazily: boto3 and strands dominate CLI startup time
+    from botocore.config import Config
+    from strands.models.bedrock import BedrockModel
+
+    return BedrockModel(
+        model_id=model_id,
+        max_tokens=max_tokens,
+        boto_client_config=Config(
+            region_name=region,
+            read_timeout=120,
+            connect_timeout=120,
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries=dict(max_attempts=3, mode="adaptive"),
+        ),
+        temperature=temperature
+    )
@@ -9,21 +9,75 @@ or an approximate word-based method as fallback.
 Features:
 - Supports both tiktoken and approximate word-based token counting
 - Supports reading input from stdin when used in pipes
+- Batch mode counts many documents in one process (one count per record)
 
 Usage:
     echo "text" | python count_tokens.py
     cat filename.txt | python count_tokens.py
+    find docs -name '*.md' -exec sh -c 'cat "$1"; printf "\0"' _ {} \; | python count_tokens.py --batch
+    cat prompts.txt | python count_tokens.py --batch --lines
+    cat filename.txt | python count_tokens.py --fast
 
 Output:
-    <number_of_tokens>
+    <number_of_tokens>  (one per line in batch mode)
 
 Requirements:
     - tiktoken (optional) for accurate token counting
+
+Note:
+    Run load_tiktoken.py at build time with TIKTOKEN_CACHE_DIR set so the
+    first invocation does not have to download the BPE files.
 """
 
+import argparse
 import re
+import string
 import sys
 
+from functools import lru_cache
+from itertools import chain
+
+_WORD_RE = re.compile(r'\w+')
+
+# Inputs at least this long are scanned with numpy (if installed) instead of the regex
+_NUMPY_MIN_CHARS = 1 << 16
+
+
+@lru_cache(maxsize=1)
+def _word_char_lut():
+    """Build a 256-entry lookup table marking ASCII word characters [A-Za-z0-9_]."""
+    import numpy as np
+    lut = np.zeros(256, dtype=np.bool_)
+    lut[[ord(c) for c in string.ascii_letters + string.digits + '_']] = True
+    return lut
+
+
+def _count_words_numpy(text):
+    """
+    Count runs of word characters in ASCII text with a vectorized byte scan.
+
+    Args:
+        text (str): ASCII text to scan (must be non-empty)
+
+    Returns:
+        int: The number of words, identical to counting _WORD_RE matches
+    """
+    import numpy as np
+    mask = _word_char_lut()[np.frombuffer(text.encode('ascii'), dtype=np.uint8)]
+    # A word starts wherever a word byte follows a non-word byte (or the start of text)
+    return int(mask[0]) + int(np.count_nonzero(mask[1:] & ~mask[:-1]))
+
+
+def _count_words(text):
+    """Count the words matched by _WORD_RE, using numpy for large ASCII inputs."""
+    # For ASCII text the regex word class is exactly [A-Za-z0-9_], so both scans agree
+    if len(text) >= _NUMPY_MIN_CHARS and text.isascii():
+        try:
+            return _count_words_numpy(text)
+        except ImportError:
+            pass  # numpy is optional; fall back to the regex scan
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 
 def count_tokens_approximate(text):
     """
@@ -36,8 +90,23 @@ def count_tokens_approximate(text):
     Returns:
         int: The approximate number of tokens
     """
-    words = re.findall(r'\b\w+\b', text)
-    return int(len(words) * 1.33)
+    words = _count_words(text)
+    return (words * 133) // 100
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model):
+    """
+    Load a tiktoken encoding once per process and reuse it across calls.
+
+    Args:
+        model (str): The encoding name (e.g. cl100k_base)
+
+    Returns:
+        tiktoken.Encoding: The cached encoding object
+    """
+    import tiktoken
+    return tiktoken.get_encoding(model)
 
 
 def count_tokens_tiktoken(text, model="cl100k_base"):
@@ -52,10 +121,7 @@ def count_tokens_tiktoken(text, model="cl100k_base"):
         int: The number of tokens
     """
     try:
-        import tiktoken
-        encoding = tiktoken.get_encoding(model)
-        tokens = encoding.encode(text)
-        return len(tokens)
+        return len(_get_encoding(model).encode(text))
 
     except Exception as e:
         print(f"Error counting tokens with tiktoken: {e}")
@@ -63,16 +129,155 @@ def count_tokens_tiktoken(text, model="cl100k_base"):
         return count_tokens_approximate(text)
 
 
+def count_tokens_fast(text):
+    """
+    Estimate the token count in O(1) from the character count.
+
+    English text averages about 4 characters per token. Use this for cheap
+    budget checks where an order-of-magnitude estimate is enough; it never
+    loads a tokenizer.
+
+    Args:
+        text (str): The text to estimate tokens for
+
+    Returns:
+        int: The estimated number of tokens (length / 4, rounded up)
+    """
+    return (len(text) + 3) >> 2
+
+
+def _iter_stripped_chunks(stream, chunk_size):
+    """
+    Yield the text of a stream in chunks, dropping the stream's leading and trailing whitespace.
+
+    Args:
+        stream (io.TextIOBase): The stream to read from
+        chunk_size (int): Number of characters to read per chunk
+
+    Yields:
+        str: Non-empty chunks whose concatenation equals stream.read().strip()
+    """
+    pending = ''  # Trailing whitespace held back until more text arrives
+    started = False
+    for chunk in iter(lambda: stream.read(chunk_size), ''):
+        if not started:
+            chunk = chunk.lstrip()
+            if not chunk:
+                continue
+            started = True
+        chunk = pending + chunk
+        text = chunk.rstrip()
+        pending = chunk[len(text):]
+        if text:
+            yield text
+
+
+def count_tokens_stream(stream, model="cl100k_base", chunk_size=1 << 20, fast=False):
+    """
+    Count tokens in a text stream chunk by chunk, without reading it all into memory.
+
+    Leading and trailing whitespace of the whole stream is ignored, matching
+    str.strip(). Tokens that straddle a chunk boundary may be counted slightly
+    differently from encoding the full text in one go.
+
+    Args:
+        stream (io.TextIOBase): The stream to read from (e.g. sys.stdin)
+        model (str): The encoding to use (default: cl100k_base)
+        chunk_size (int): Number of characters to read per chunk (default: 1 MiB)
+        fast (bool): If True, estimate from the character count like count_tokens_fast()
+
+    Returns:
+        int: The number of tokens, or None if the stream is empty or all whitespace
+    """
+    chunks = _iter_stripped_chunks(stream, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return None
+    chunks = chain((first,), chunks)
+
+    if fast:
+        chars = sum(len(chunk) for chunk in chunks)
+        return (chars + 3) >> 2
+
+    # Only loaded once there is something to count
+    try:
+        encoding = _get_encoding(model)
+    except Exception as e:
+        print(f"Error counting tokens with tiktoken: {e}")
+        encoding = None
+
+    total = 0
+    for chunk in chunks:
+        if encoding is not None:
+            try:
+                # encode_ordinary treats special-token text such as <|endoftext|> as plain
+                # text, matching count_tokens_batch
+                total += len(encoding.encode_ordinary(chunk))
+                continue
+            except Exception as e:
+                print(f"Error counting tokens with tiktoken: {e}")
+                encoding = None
+        # Fallback to approximate method (for this chunk and the rest of the stream)
+        total += count_tokens_approximate(chunk)
+    return total
+
+
+def count_tokens_batch(texts, model="cl100k_base"):
+    """
+    Count tokens for many texts at once using tiktoken's batch encoder.
+
+    encode_ordinary_batch spreads the work across threads in the Rust
+    tokenizer, which is much faster than encoding each text in turn.
+
+    Args:
+        texts (list): The texts to count tokens for
+        model (str): The encoding to use (default: cl100k_base)
+
+    Returns:
+        list: The number of tokens in each text, in input order
+    """
+    try:
+        encoding = _get_encoding(model)
+        return [len(tokens) for tokens in encoding.encode_ordinary_batch(texts)]
+
+    except Exception as e:
+        print(f"Error counting tokens with tiktoken: {e}")
+        # Fallback to approximate method
+        return [count_tokens_approximate(text) for text in texts]
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count tokens in text read from stdin")
+    parser.add_argument('--batch', action='store_true',
+                        help="Treat stdin as NUL-delimited records and print one count per record")
+    parser.add_argument('--lines', action='store_true',
+                        help="With --batch, split records on newlines instead of NUL")
+    parser.add_argument('--fast', action='store_true',
+                        help="Estimate tokens as characters / 4 instead of running the tokenizer")
+    args = parser.parse_args()
+
     # Check if stdin is connected to a terminal (interactive) or a pipe/file
     if sys.stdin.isatty():
         # Interactive terminal - no piped input, run interactive agent
         pass
     else:
         # Input is being piped or redirected
-        user_input = sys.stdin.read().strip()
-        if user_input:
-            tokens = count_tokens_tiktoken(user_input)
-            print(tokens)
+        if args.batch:
+            records = sys.stdin.read().split('\n' if args.lines else '\0')
+            if records and not records[-1].strip():
+                records.pop()  # Ignore the empty record after a trailing delimiter
+            records = [record.strip() for record in records]
+            if args.fast:
+                counts = [count_tokens_fast(record) for record in records]
+            else:
+                counts = count_tokens_batch(records)
+            if counts:
+                print("\n".join(str(count) for count in counts))
+            else:
+                print("No input provided")
         else:
-            print("No input provided")
+            tokens = count_tokens_stream(sys.stdin, fast=args.fast)
+            if tokens is None:
+                print("No input provided")
+            else:
+                print(tokens)
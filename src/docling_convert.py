@@ -21,36 +21,62 @@ import os
 import subprocess
 import sys
 
-from docling.document_converter import DocumentConverter as DoclingConverter
-from docling.document_converter import DocumentConverter
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import VlmPipelineOptions
-from docling.datamodel import vlm_model_specs
-from docling.document_converter import PdfFormatOption
-from docling.pipeline.vlm_pipeline import VlmPipeline
-
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
 
-# Set up logging
-logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[logging.StreamHandler()]
-)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logging.getLogger("strands").setLevel(logging.INFO)
+
+# Converter is expensive to build (loads layout/OCR/table models), so reuse one per process
+_CONVERTER = None
+
+
+def _get_converter():
+    """Return the shared docling DocumentConverter, creating it on first use."""
+    global _CONVERTER
+    if _CONVERTER is None:
+        # Imported lazily: docling pulls in torch and friends, which dominates CLI startup
+        from docling.document_converter import DocumentConverter as DoclingConverter
+        _CONVERTER = DoclingConverter()
+    return _CONVERTER
+
+
+# Inputs that are already markdown/plain text and don't need docling at all
+_PASSTHROUGH_SUFFIXES = {'.md', '.markdown', '.txt'}
+
+
+def _read_passthrough(file_path_or_url: str):
+    """
+    Return the text of a markdown or plain-text input without running docling.
+
+    Args:
+        file_path_or_url (str): Path to local file or URL of document to convert
+
+    Returns:
+        str: The file contents, or None if the input needs converting with docling
+    """
+    parsed = urlparse(file_path_or_url)
+    if Path(parsed.path).suffix.lower() not in _PASSTHROUGH_SUFFIXES:
+        return None
+
+    logger.info(f"{file_path_or_url} is already text, skipping docling")
+    if parsed.scheme in ('http', 'https'):
+        import requests
+        response = requests.get(file_path_or_url, timeout=30)
+        response.raise_for_status()
+        return response.text
+    return Path(file_path_or_url).read_text()
+
+
+def warmup():
+    """
+    Eagerly construct the shared docling converter.
+
+    Useful for long-running processes that want to pay the model-loading
+    cost up front rather than on the first conversion.
+    """
+    _get_converter()
 
 
 def convert_with_docling(file_path_or_url: str) -> str:
@@ -67,10 +93,13 @@ def convert_with_docling(file_path_or_url: str) -> str:
         https://github.com/docling-project/docling
     """
     try:
+        markdown_str = _read_passthrough(file_path_or_url)
+        if markdown_str is not None:
+            return markdown_str
+
         logger.info(f"Converting {file_path_or_url} to markdown using docling...")
         
-        converter = DoclingConverter()
-        result = converter.convert(file_path_or_url)
+        result = _get_converter().convert(file_path_or_url)
         
         markdown_str = result.document.export_to_markdown()
         logger.info(f"Successfully converted {file_path_or_url} to markdown with docling")
@@ -84,6 +113,10 @@ def convert_with_docling(file_path_or_url: str) -> str:
 def convert_with_docling_cli(file_path_or_url: str):
     """
     Call docling CLI to convert document to markdown
+
+    Note:
+        This spawns a new interpreter that reloads all docling models on every
+        call. Prefer convert_with_docling(), which reuses a cached converter.
     
     Args:
         file_path_or_url (str): Path to local file or URL of document to convert
@@ -101,6 +134,10 @@ def convert_with_docling_cli(file_path_or_url: str):
     """
 
     try:
+        markdown_str = _read_passthrough(file_path_or_url)
+        if markdown_str is not None:
+            return markdown_str
+
         # Run docling command and capture output
         result = subprocess.run(
             ["docling", file_path_or_url],
@@ -118,25 +155,40 @@ def convert_with_docling_cli(file_path_or_url: str):
         return ""    
 
 
-def main(user_input, use_cli = True):
+def main(user_input, use_cli = False):
     if use_cli:
         print(convert_with_docling_cli(user_input))
     else:
         print(convert_with_docling(user_input))
 
+@lru_cache(maxsize=1)
 def get_stdin():
+    # Cached so a second call doesn't block on (or re-read) an already drained pipe
     # Check if stdin is connected to a terminal (interactive) or a pipe/file
     if sys.stdin.isatty():
         return ''  # Interactive terminal - no piped input
     else:
-        return sys.stdin.read().strip()  # Input is being piped or redirected
+        return sys.stdin.readline().strip()  # Only the first line (file path or URL) is needed
 
 if __name__ == "__main__":
+    # Set up logging (only when run as a script, so importers keep their own configuration)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(levelname)s | %(name)s | %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        handlers=[logging.StreamHandler()]
+    )
+    logger.setLevel(logging.INFO)
+
     parser = argparse.ArgumentParser(description="Convert document to markdown using docling")
     parser.add_argument('--file_path_or_url', default='')
-    parser.add_argument('--use_cli', action='store_true')
+    parser.add_argument('--use_cli', action='store_true',
+                        help="Shell out to the docling CLI instead of the in-process converter (debugging only)")
     args = parser.parse_args()
 
+    # Large markdown documents: use a 1 MiB stdout buffer so output goes out in a few big writes
+    sys.stdout = os.fdopen(sys.stdout.fileno(), 'w', buffering=1 << 20, closefd=False)
+
     user_input = get_stdin()
     if user_input:
         logger.info(f'Using docling to parser: {user_input}, with --use_cli={args.use_cli}')
@@ -144,7 +196,10 @@ if __name__ == "__main__":
     else:
         file_path_or_url = args.file_path_or_url
         if file_path_or_url:
-            markdown_str = convert_with_docling_cli(file_path_or_url)
+            if args.use_cli:
+                markdown_str = convert_with_docling_cli(file_path_or_url)
+            else:
+                markdown_str = convert_with_docling(file_path_or_url)
             if markdown_str:
                 print(markdown_str)
             else:
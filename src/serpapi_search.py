@@ -11,21 +11,26 @@ A Python client library for interacting with the SerpAPI Google Local API. Provi
 - Pagination through results
 
 Requires authentication via SerpAPI key. Sign up at https://serpapi.com/
+
+Requests go straight to https://serpapi.com/search.json over a pooled, keep-alive
+httpx client, so the google-search-results (serpapi) SDK is not required.
+
+Installation:
+  uv pip install httpx cachetools python-dotenv boto3 strands-agents
 """
 
-import boto3
+import asyncio
+import httpx
 import json
 import logging
 import os
-import requests
 import sys
+import threading
 
-from botocore.config import Config
+from cachetools import TTLCache
 from datetime import datetime
 from dotenv import load_dotenv
-from serpapi import GoogleSearch
-from strands import Agent, tool
-from strands.models.bedrock import BedrockModel
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
 
@@ -35,6 +40,8 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
+# httpx logs every request URL at INFO, and SerpAPI URLs carry the api_key
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 load_dotenv()
 
@@ -46,9 +53,137 @@ if not SERPAPI_API_KEY:
         "Please set it in your .env file or provide it as a parameter."
     )
 
+SERPAPI_BASE_URL = "https://serpapi.com"
+
+# One pooled async client per event loop. Strands may run each agent invocation
+# on a fresh loop, and httpx connections cannot be shared across loops.
+# Entries are removed (and the client closed) when their loop shuts down.
+_ACLIENTS: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+# Strong references to the tasks that do that; the event loop only keeps weak ones
+_CLOSERS: set = set()
+
+# SerpAPI is paid and rate limited, so identical queries within a session are served from memory
+_RESPONSE_CACHE = TTLCache(maxsize=1024, ttl=300)
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Requests currently on the wire, keyed by (event loop, cache key), so concurrent
+# identical tool calls share one HTTP round trip instead of each paying for it
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the pooled SerpAPI client for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _ACLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=SERPAPI_BASE_URL,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
+        _ACLIENTS[loop] = client
+        closer = loop.create_task(_close_with_loop(loop, client))
+        _CLOSERS.add(closer)
+        closer.add_done_callback(_CLOSERS.discard)
+    return client
+
+
+async def _close_with_loop(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Wait until the loop shuts down, then close its client's connection pool.
+
+    asyncio.run() cancels leftover tasks before closing the loop, so this runs
+    at the end of every Strands agent invocation.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if _ACLIENTS.get(loop) is client:
+            del _ACLIENTS[loop]
+        await client.aclose()
+
+
+async def _serpapi_get(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send a search request to SerpAPI over the pooled async client.
+
+    Args:
+        params: SerpAPI query parameters, including engine and api_key
+
+    Returns:
+        Dictionary containing the decoded JSON response
 
-@tool
-def search_google(query: str, api_key: Optional[str] = SERPAPI_API_KEY) -> Dict[str, Any]:
+    Raises:
+        httpx.HTTPError: If the API request fails
+    """
+    # Drop unset optional parameters rather than sending them as empty strings
+    params = {k: v for k, v in params.items() if v is not None}
+
+    cache_key = _cache_key(params)
+    with _RESPONSE_CACHE_LOCK:
+        results = _RESPONSE_CACHE.get(cache_key)
+    if results is not None:
+        logger.info(f"Serving cached SerpAPI results for engine={params.get('engine')}")
+        return results
+
+    loop = asyncio.get_running_loop()
+    inflight_key = (loop, cache_key)
+    pending = _INFLIGHT.get(inflight_key)
+    if pending is not None:
+        logger.info(f"Joining in-flight SerpAPI request for engine={params.get('engine')}")
+        # Shielded so a cancelled waiter doesn't cancel the request for everyone else
+        return await asyncio.shield(pending)
+
+    future = loop.create_future()
+    future.add_done_callback(_consume_exception)
+    _INFLIGHT[inflight_key] = future
+    try:
+        response = await _get_async_client().get("/search.json", params=params)
+        response.raise_for_status()
+        results = response.json()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        error = _redact_api_key(e, params.get("api_key"))
+        future.set_exception(error)
+        if error is e:
+            raise
+        # Drop the original from the chain too, since tracebacks would print it
+        raise error from None
+    finally:
+        _INFLIGHT.pop(inflight_key, None)
+
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[cache_key] = results
+    future.set_result(results)
+    return results
+
+
+def _redact_api_key(error: Exception, api_key: Optional[str]) -> Exception:
+    """Return error, or an httpx.HTTPError with the same message minus api_key if it contains the key.
+
+    httpx error messages include the request URL, and these errors are logged and
+    passed back to the model as tool errors.
+    """
+    message = str(error)
+    if not api_key or api_key not in message:
+        return error
+    return httpx.HTTPError(message.replace(api_key, "<redacted>"))
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Mark a shared future's exception as retrieved when nobody else was waiting on it."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _cache_key(params: Dict[str, Any]) -> frozenset:
+    """Build a hashable cache key from query parameters, ignoring the API key."""
+    return frozenset((k, v) for k, v in params.items() if k != "api_key")
+
+
+async def search_google(query: str, api_key: Optional[str] = SERPAPI_API_KEY) -> Dict[str, Any]:
     """
     Search Google using SerpAPI and return the search results.
 
@@ -61,7 +196,7 @@ def search_google(query: str, api_key: Optional[str] = SERPAPI_API_KEY) -> Dict[
             - pagination: Pagination details
 
     Raises:
-        requests.exceptions.RequestException: If the API request fails
+        httpx.HTTPError: If the API request fails
         ValueError: If API key is missing or invalid
 
     Example:
@@ -85,8 +220,7 @@ def search_google(query: str, api_key: Optional[str] = SERPAPI_API_KEY) -> Dict[
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = await _serpapi_get(params)
         organic_results = results["organic_results"]
         return organic_results
     except Exception as e:
@@ -94,8 +228,7 @@ def search_google(query: str, api_key: Optional[str] = SERPAPI_API_KEY) -> Dict[
         raise
 
 
-@tool
-def search_google_flights(departure_id: str, arrival_id: str, outbound_date: str, return_date: str, currency: str = "USD", api_key: Optional[str] = SERPAPI_API_KEY):
+async def search_google_flights(departure_id: str, arrival_id: str, outbound_date: str, return_date: str, currency: str = "USD", api_key: Optional[str] = SERPAPI_API_KEY):
     """
     Search for flights using Google Flights via SerpAPI.
 
@@ -130,16 +263,14 @@ def search_google_flights(departure_id: str, arrival_id: str, outbound_date: str
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = await _serpapi_get(params)
         return results
     except Exception as e:
         logger.error(f"Error fetching search results: {e}")
         raise
 
 
-@tool
-def search_google_hotels(query: str, check_in_date: str, check_out_date: str, adults: int = 2, currency: str = "USD", api_key: Optional[str] = SERPAPI_API_KEY):
+async def search_google_hotels(query: str, check_in_date: str, check_out_date: str, adults: int = 2, currency: str = "USD", api_key: Optional[str] = SERPAPI_API_KEY):
     """
     Search for hotels using Google Hotels via SerpAPI.
 
@@ -174,16 +305,14 @@ def search_google_hotels(query: str, check_in_date: str, check_out_date: str, ad
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = await _serpapi_get(params)
         return results
     except Exception as e:
         logger.error(f"Error fetching search results: {e}")
         raise
 
 
-@tool
-def search_local_businesses(
+async def search_local_businesses(
     query: str,
     location: Optional[str] = None,
     gl: Optional[str] = None,
@@ -210,7 +339,7 @@ def search_local_businesses(
             - pagination: Pagination details
 
     Raises:
-        requests.exceptions.RequestException: If the API request fails
+        httpx.HTTPError: If the API request fails
         ValueError: If API key is missing or invalid
 
     Example:
@@ -238,8 +367,7 @@ def search_local_businesses(
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = await _serpapi_get(params)
         local_results = results["local_results"]
         logger.info(f"Successfully searched for '{query}' in {location or 'default location'}")
         return local_results
@@ -248,8 +376,7 @@ def search_local_businesses(
         raise
 
 
-@tool
-def search_google_maps(query: str, latitude: float, longitude: float, zoom: int = 14, api_key: Optional[str] = SERPAPI_API_KEY):
+async def search_google_maps(query: str, latitude: float, longitude: float, zoom: int = 14, api_key: Optional[str] = SERPAPI_API_KEY):
     """
     Search Google Maps using SerpAPI.
 
@@ -286,8 +413,7 @@ def search_google_maps(query: str, latitude: float, longitude: float, zoom: int
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = await _serpapi_get(params)
         return results
     except Exception as e:
         logger.error(f"Error fetching search results: {e}")
@@ -298,21 +424,6 @@ def search_google_maps(query: str, latitude: float, longitude: float, zoom: int
 AWS_DEFAULT_REGION = os.getenv('AWS_DEFAULT_REGION', 'us-west-2')
 BEDROCK_MODEL_ID = os.getenv('BEDROCK_MODEL_ID', 'us.amazon.nova-lite-v1:0')
 
-# Create AWS session
-session = boto3.Session()
-
-# Create Bedrock model
-model = BedrockModel(
-    model_id=BEDROCK_MODEL_ID,
-    max_tokens=2048,
-    boto_client_config=Config(
-        read_timeout=120,
-        connect_timeout=120,
-        retries=dict(max_attempts=3, mode="adaptive"),
-    ),
-    boto_session=session
-)
-
 SERPAPI_SYSTEM_PROMPT = """You are a helpful local business search assistant powered by Google Local via SerpAPI.
 
 You can help users with:
@@ -338,17 +449,46 @@ For hotels, include rates, amenities, and location details.
 If multiple results are found, present them in a clear, organized format.
 """
 
-serpapi_agent = Agent(
-    model=model,
-    system_prompt=SERPAPI_SYSTEM_PROMPT,
-    tools=[
-        search_google,
-        search_google_flights,
-        search_google_hotels,
-        search_local_businesses,
-        search_google_maps
-    ]
-)
+
+@lru_cache(maxsize=1)
+def get_agent():
+    """
+    Build the SerpAPI agent on first use.
+
+    boto3 and strands are imported here rather than at module load, so piping
+    a query or importing a search function does not pay for them up front.
+    """
+    import boto3
+    from botocore.config import Config
+    from strands import Agent, tool
+    from strands.models.bedrock import BedrockModel
+
+    # Create AWS session
+    session = boto3.Session()
+
+    # Create Bedrock model
+    model = BedrockModel(
+        model_id=BEDROCK_MODEL_ID,
+        max_tokens=2048,
+        boto_client_config=Config(
+            read_timeout=120,
+            connect_timeout=120,
+            retries=dict(max_attempts=3, mode="adaptive"),
+        ),
+        boto_session=session
+    )
+
+    return Agent(
+        model=model,
+        system_prompt=SERPAPI_SYSTEM_PROMPT,
+        tools=[
+            tool(search_google),
+            tool(search_google_flights),
+            tool(search_google_hotels),
+            tool(search_local_businesses),
+            tool(search_google_maps)
+        ]
+    )
 
 EXAMPLE_PROMPTS = [
     "Find coffee shops in Singapore",
@@ -402,7 +542,7 @@ def run_interactive_agent():
 
             # Add timeout handling
             try:
-                response = serpapi_agent(user_input, timeout=60)
+                response = get_agent()(user_input, timeout=60)
             except TimeoutError:
                 print("\nRequest timed out. Please try again.")
                 continue
@@ -419,7 +559,9 @@ def run_interactive_agent():
             print("Please try again or type 'exit' to quit.")
 
 
+@lru_cache(maxsize=1)
 def get_stdin():
+    # Cached so a second call doesn't block on (or re-read) an already drained pipe
     # Check if stdin is connected to a terminal (interactive) or a pipe/file
     if sys.stdin.isatty():
         return ''  # Interactive terminal - no piped input
@@ -428,7 +570,7 @@ def get_stdin():
 
 
 def main(user_input):
-    response = serpapi_agent(user_input)
+    response = get_agent()(user_input)
     print(response)
 
 
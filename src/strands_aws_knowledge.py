@@ -72,26 +72,33 @@ Example usage:
     echo "Explain the difference between AWS Lambda and AWS Fargate" | python strands_aws_knowledge.py
     echo "What's the recommended architecture for a highly available web application?" | python strands_aws_knowledge.py
     echo "Show me recent announcements about Amazon EKS" | python strands_aws_knowledge.py
-    cat questions.txt | python strands_aws_knowledge.py
+    cat questions.txt | python strands_aws_knowledge.py --lines    # one question per line
     python strands_aws_knowledge.py < input.txt
-    python strands_aws_knowledge.py --npx < questions.txt
+    python strands_aws_knowledge.py --npx --lines < questions.txt
 
 Announcement: https://aws.amazon.com/about-aws/whats-new/2025/07/aws-knowledge-mcp-server-available-preview/
 Github: https://github.com/awslabs/mcp/tree/main/src/aws-knowledge-mcp-server
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
 import logging
 import os
 import sys
+import threading
 
-from botocore.config import Config
-from mcp import stdio_client, StdioServerParameters
+from contextlib import ExitStack
 from shutil import which
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from strands.tools.mcp.mcp_client import MCPClient
-from strands.handlers.callback_handler import PrintingCallbackHandler
+from typing import TYPE_CHECKING
+
+# boto3, mcp and strands take around a second to import, so they are imported
+# where they are first needed; --help and the no-input path skip them entirely
+if TYPE_CHECKING:
+    from strands import Agent
+    from strands.models.bedrock import BedrockModel
+    from strands.tools.mcp.mcp_client import MCPClient
 
 logging.basicConfig(
     level=logging.INFO,
@@ -107,6 +114,22 @@ HOME = os.getenv('HOME')
 BEDROCK_REGION = os.getenv("BEDROCK_REGION", 'us-west-2')
 BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.amazon.nova-lite-v1:0")
 
+# Resolve the MCP launchers once rather than searching PATH on every client creation
+NPX_PATH = which('npx')
+UVX_PATH = which('uvx')
+
+# Started MCP sessions, their tool lists and agents, keyed by transport ('npx' or 'uvx').
+# Starting the MCP server subprocess and handshaking takes seconds, so do it once per process.
+_MCP_CLIENT_CACHE: dict[str, MCPClient] = {}
+_TOOLS_CACHE: dict[str, list] = {}
+_AGENT_CACHE: dict[str, Agent] = {}
+_CACHE_LOCK = threading.Lock()
+
+# Keeps cached MCP sessions open until the interpreter exits
+_EXIT_STACK = ExitStack()
+atexit.register(_EXIT_STACK.close)
+
+
 def create_mcp_client(use_npx: bool = False) -> MCPClient:
     """Create an MCP client for the AWS Knowledge MCP Server.
     
@@ -119,8 +142,11 @@ def create_mcp_client(use_npx: bool = False) -> MCPClient:
     Raises:
         RuntimeError: If required command is not found
     """
+    from mcp import stdio_client, StdioServerParameters
+    from strands.tools.mcp.mcp_client import MCPClient
+
     if use_npx:
-        cmd = which('npx')
+        cmd = NPX_PATH
         if not cmd:
             raise RuntimeError("npx command not found. Please install Node.js and npm.")
         return MCPClient(lambda: stdio_client(
@@ -133,7 +159,7 @@ def create_mcp_client(use_npx: bool = False) -> MCPClient:
             )
         ))
     else:
-        cmd = which('uvx')
+        cmd = UVX_PATH
         if not cmd:
             raise RuntimeError("uvx command not found. Please install uvx.")
         return MCPClient(lambda: stdio_client(
@@ -148,17 +174,12 @@ def create_mcp_client(use_npx: bool = False) -> MCPClient:
             )
         ))
 
-model = BedrockModel(
-    model_id=BEDROCK_MODEL_ID,
-    max_tokens=2048,
-    boto_client_config=Config(
-        region_name=BEDROCK_REGION,
-        read_timeout=120,
-        connect_timeout=120,
-        retries=dict(max_attempts=3, mode="adaptive"),
-    ),
-    temperature=0.1
-)
+
+def get_model() -> BedrockModel:
+    """Return the Bedrock model shared with the other agent scripts, creating it on first use."""
+    from _bedrock import get_shared_bedrock_model
+    return get_shared_bedrock_model(BEDROCK_REGION, BEDROCK_MODEL_ID, temperature=0.1)
+
 
 SYSTEM_PROMPT = """You are an AWS Knowledge assistant with access to AWS documentation and guidance.
 
@@ -171,6 +192,49 @@ Use the available tools to:
 Provide accurate AWS knowledge and guidance based on user questions.
 """
 
+def get_mcp_tools(use_npx: bool = False) -> list:
+    """Return the MCP tools for a transport, starting and caching its MCP session on first use.
+
+    Args:
+        use_npx: If True, use npx instead of uvx for the MCP client
+
+    Returns:
+        list: Tools exposed by the AWS Knowledge MCP Server
+    """
+    key = 'npx' if use_npx else 'uvx'
+    with _CACHE_LOCK:
+        if key not in _TOOLS_CACHE:
+            mcp_client = _EXIT_STACK.enter_context(create_mcp_client(use_npx=use_npx))
+            _MCP_CLIENT_CACHE[key] = mcp_client
+            _TOOLS_CACHE[key] = mcp_client.list_tools_sync()
+        return _TOOLS_CACHE[key]
+
+
+def get_agent(use_npx: bool = False) -> Agent:
+    """Return the cached AWS Knowledge agent for a transport, creating it on first use.
+
+    Args:
+        use_npx: If True, use npx instead of uvx for the MCP client
+
+    Returns:
+        Agent: Strands agent bound to the AWS Knowledge MCP tools
+    """
+    from strands import Agent
+    from strands.handlers.callback_handler import PrintingCallbackHandler
+
+    key = 'npx' if use_npx else 'uvx'
+    tools = get_mcp_tools(use_npx=use_npx)
+    with _CACHE_LOCK:
+        if key not in _AGENT_CACHE:
+            _AGENT_CACHE[key] = Agent(
+                system_prompt=SYSTEM_PROMPT,
+                model=get_model(),
+                tools=tools,
+                callback_handler=PrintingCallbackHandler()
+            )
+        return _AGENT_CACHE[key]
+
+
 def process_input(input_text, use_npx=False):
     """
     Process AWS-related questions using Strands Agent with AWS Knowledge MCP Server
@@ -180,39 +244,43 @@ def process_input(input_text, use_npx=False):
         use_npx (bool): If True, use npx instead of uvx for the MCP client
 
     Returns:
-        str: output generated by the agent
+        str: output generated by the agent, or None if the question failed
     """
     try:
-        # Create MCP client
-        mcp_client = create_mcp_client(use_npx=use_npx)
-        
-        with mcp_client:
-            # Get available tools
-            tools = mcp_client.list_tools_sync()
-            
-            # Create agent
-            aws_knowledge_agent = Agent(
-                system_prompt=SYSTEM_PROMPT,
-                model=model,
-                tools=tools,
-                callback_handler=PrintingCallbackHandler()
-            )
-            
-            return aws_knowledge_agent(input_text)
-            
+        aws_knowledge_agent = get_agent(use_npx=use_npx)
+
+        # Each question is answered independently of earlier ones
+        aws_knowledge_agent.messages = []
+        return aws_knowledge_agent(input_text)
+
     except Exception as e:
         logger.error(f"Error processing input: {e}")
-        sys.exit(1)
+        return None
 
-def main(stdin_input, args):
-    print(process_input(stdin_input, use_npx=args.npx))
+def main(questions, args):
+    # All questions go through the same MCP session and agent, so the server starts only once
+    failures = 0
+    for question in questions:
+        response = process_input(question, use_npx=args.npx)
+        if response is None:
+            # Keep answering the remaining questions; report the failure in the exit code
+            failures += 1
+            continue
+        print(response)
+    if failures:
+        logger.error(f"{failures} of {len(questions)} question(s) failed")
+        sys.exit(1)
 
-def get_stdin():
+def get_stdin(lines=False):
     # Check if stdin is connected to a terminal (interactive) or a pipe/file
     if sys.stdin.isatty():
-        return ''  # Interactive terminal - no piped input
-    else:
-        return sys.stdin.read().strip()  # Input is being piped or redirected
+        return []  # Interactive terminal - no piped input
+    # Input is being piped or redirected: the whole input is one question,
+    # or with lines=True, each non-blank line is a separate question
+    text = sys.stdin.read()
+    if lines:
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    return [text.strip()] if text.strip() else []
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -223,10 +291,15 @@ if __name__ == "__main__":
         action='store_true',
         help='Use npx instead of uvx for the MCP client'
     )
+    parser.add_argument(
+        '--lines',
+        action='store_true',
+        help='Treat each non-blank line of stdin as a separate question'
+    )
     args = parser.parse_args()
 
-    stdin_input = get_stdin()
-    if stdin_input:
-        main(stdin_input, args)
+    questions = get_stdin(lines=args.lines)
+    if questions:
+        main(questions, args)
     else:
         print("No input provided. Usage: echo 'Your AWS question' | python strands_aws_knowledge.py")
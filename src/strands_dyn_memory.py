@@ -6,28 +6,39 @@ Memory Storage Agent - Stores information in DynamoDB as memory items
 Usage:
   echo "Store this web page: https://example.com" | python memory_agent.py
   echo "Remember that Python 3.12 was released in October 2023" | python memory_agent.py
+  echo "What did I save about #python recently?" | python memory_agent.py --recall
 
 The agent will:
 1. Detect if input contains a URL and fetch its content
 2. Generate a TLDR and hashtags
 3. Store in DynamoDB with timestamp and metadata
+
+With --recall, the input is a question instead, answered by an agent that can
+list recent memories and search them by hashtag.
+
+Installation:
+  uv pip install boto3 strands-agents aiohttp
+
+aiohttp is optional: without it, several URLs are fetched one thread each
+through web2markdown.py instead of over a shared connection pool.
 """
 
+import argparse
+import asyncio
+import codecs
 import json
 import logging
 import os
 import re
-import subprocess
 import sys
+import threading
+import uuid
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError
-from strands import Agent, tool
-from strands.handlers.callback_handler import PrintingCallbackHandler
-from strands.models.bedrock import BedrockModel
+# boto3 and strands take around a second to import, so they are imported where
+# they are first needed; the no-input path exits without loading them
 
 # Set up logging
 logging.basicConfig(
@@ -45,38 +56,86 @@ BEDROCK_REGION = os.getenv("BEDROCK_REGION", 'us-west-2')
 BEDROCK_MODEL_ID = "us.amazon.nova-lite-v1:0"
 DYNAMODB_REGION = os.getenv("DYNAMODB_REGION", BEDROCK_REGION)
 MEMORY_TABLE_NAME = os.getenv("MEMORY_TABLE_NAME", "AIMemories")
+MAX_CONTENT_CHARS = 10000  # Limit fetched content length to avoid token limits
+MEMORY_ID_ATTEMPTS = 3  # Times to regenerate a colliding memory_id before giving up
+MAX_TLDR_CHARS = 300  # Longer model summaries are cut down rather than rejected
+MAX_HASHTAGS = 5
+
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+# One row per (hashtag, memory_id) so hashtag search is a Query instead of a full-table Scan
+HASHTAG_TABLE_NAME = os.getenv("HASHTAG_TABLE_NAME", f"{MEMORY_TABLE_NAME}Hashtags")
+# GSI over every memory (constant partition key 'pk' = 'ALL') sorted by timestamp, for newest-first listing
+RECENT_INDEX_NAME = "RecentIndex"
+RECENT_INDEX_PK = "ALL"
+# Attributes shown by list_recent_memories; skipping 'content' (up to ~10KB per item) cuts read
+# capacity and payload size. 'timestamp' is a reserved word, hence the placeholder.
+LISTING_PROJECTION = {
+    'ProjectionExpression': 'memory_id, tldr, hashtags, created_at, source_url, #ts',
+    'ExpressionAttributeNames': {'#ts': 'timestamp'},
+}
+
+# Once both tables are known to exist, skip the DescribeTable round trips for the rest of the process
+_TABLE_READY = False
+_TABLE_LOCK = threading.Lock()
+
+SYSTEM_PROMPT = """You are a memory storage assistant. Given user input (and the content
+of any web pages it mentions), extract the key information and summarize it as a
+concise TLDR with relevant hashtags, so it can be stored for later retrieval.
 
-# Initialize AWS clients
-dynamodb_client = boto3.client('dynamodb', region_name=DYNAMODB_REGION)
-dynamodb_resource = boto3.resource('dynamodb', region_name=DYNAMODB_REGION)
-
-# Initialize Strands Model
-model = BedrockModel(
-    model_id=BEDROCK_MODEL_ID,
-    max_tokens=2048,
-    boto_client_config=Config(
-        read_timeout=120,
-        connect_timeout=120,
-        retries=dict(max_attempts=3, mode="adaptive"),
-    ),
-    temperature=0.3
-)
+Be concise, accurate, and organize information in a structured way."""
 
-SYSTEM_PROMPT = """You are a memory storage assistant. Your job is to:
-1. Process user input to extract key information
-2. If a URL is mentioned, fetch and analyze the web content
-3. Create concise summaries (TLDR) and relevant hashtags
-4. Store the information in DynamoDB for later retrieval
+RECALL_SYSTEM_PROMPT = """You are a memory retrieval assistant. Answer questions about the
+memories stored in DynamoDB:
+1. List recent memories or search them by hashtag
+2. If a stored memory points to a URL and more detail is needed, fetch the web content
+
+When tool calls do not depend on each other's results, request them together in a
+single response instead of one per turn.
 
 Be concise, accurate, and organize information in a structured way."""
 
 
 # ============================================================================
-# Tools
+# AWS Clients
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def get_dynamodb():
+    """
+    Create the DynamoDB client and resource on first use.
+
+    Keep-alive connections stay warm between tool calls.
+
+    Returns:
+        (client, resource): boto3 DynamoDB client and resource
+    """
+    import boto3
+    from botocore.config import Config
+
+    dynamodb_config = Config(max_pool_connections=50, tcp_keepalive=True)
+    dynamodb_client = boto3.client('dynamodb', region_name=DYNAMODB_REGION, config=dynamodb_config)
+    dynamodb_resource = boto3.resource('dynamodb', region_name=DYNAMODB_REGION, config=dynamodb_config)
+    return dynamodb_client, dynamodb_resource
+
+
+@lru_cache(maxsize=2)
+def get_table(table_name: str):
+    """Return the boto3 Table resource for table_name."""
+    return get_dynamodb()[1].Table(table_name)
+
+
+def get_model():
+    """Get the Strands Bedrock model (built once by _bedrock, which lives next to this script)."""
+    from _bedrock import get_shared_bedrock_model
+    return get_shared_bedrock_model(BEDROCK_REGION, BEDROCK_MODEL_ID, temperature=0.3)
+
+
+# ============================================================================
+# Tools (main calls the fetch/store ones directly; recall() wraps the fetch and
+# lookup ones with strands' tool() for its agent)
 # ============================================================================
 
-@tool
-def fetch_webpage_content(url: str) -> str:
+async def fetch_webpage_content(url: str) -> str:
     """
     Fetch webpage content and convert to markdown using web2markdown.py.
     
@@ -86,6 +145,21 @@ def fetch_webpage_content(url: str) -> str:
     Returns:
         Markdown content of the webpage or error message
     """
+    # Fetch in-process when web2markdown is importable (it lives next to this script);
+    # otherwise fall back to running it as a subprocess
+    try:
+        from web2markdown import jina_to_markdown
+    except ImportError:
+        jina_to_markdown = None
+
+    # Both paths wait without blocking the event loop, so other tool calls keep running
+    if jina_to_markdown is not None:
+        try:
+            content = await asyncio.to_thread(jina_to_markdown, url, timeout=30, max_chars=MAX_CONTENT_CHARS)
+            return _truncate_content(content.strip())
+        except Exception as e:
+            return f"Error fetching webpage: {str(e)}"
+
     try:
         # Get the directory of the current script
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -95,71 +169,122 @@ def fetch_webpage_content(url: str) -> str:
             return f"Error: web2markdown.py not found at {web2markdown_path}"
         
         # Use jina engine by default (no external dependencies needed)
-        result = subprocess.run(
-            ['python', web2markdown_path, '--engine', 'jina'],
-            input=url,
-            capture_output=True,
-            text=True,
-            timeout=30
+        proc = await asyncio.create_subprocess_exec(
+            'python', web2markdown_path, '--engine', 'jina',
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(url.encode()), timeout=30)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return "Error: Timeout while fetching webpage"
         
-        if result.returncode == 0:
-            content = result.stdout.strip()
-            # Limit content length to avoid token limits
-            if len(content) > 10000:
-                content = content[:10000] + "\n\n[Content truncated...]"
-            return content
+        if proc.returncode == 0:
+            return _truncate_content(stdout.decode(errors='replace').strip())
         else:
-            return f"Error fetching webpage: {result.stderr}"
+            return f"Error fetching webpage: {stderr.decode(errors='replace')}"
     
-    except subprocess.TimeoutExpired:
-        return "Error: Timeout while fetching webpage"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
-@tool
-def ensure_memory_table_exists() -> str:
+async def fetch_webpages_content(urls: list[str]) -> dict:
     """
-    Check if the memory table exists, create it if it doesn't.
+    Fetch several webpages concurrently via Jina AI and return their markdown.
+    Use this instead of repeated fetch_webpage_content calls when there is more than one URL.
+    
+    Args:
+        urls: The URLs to fetch
     
     Returns:
-        Status message
+        Dictionary mapping each URL to its markdown content or an error message
     """
     try:
-        # Check if table exists
-        dynamodb_client.describe_table(TableName=MEMORY_TABLE_NAME)
-        return f"Memory table '{MEMORY_TABLE_NAME}' already exists"
+        import aiohttp
+    except ImportError:
+        logger.info("aiohttp is not installed; fetching each URL with fetch_webpage_content")
+        contents = await asyncio.gather(*(fetch_webpage_content(url) for url in urls))
+        return dict(zip(urls, contents))
+
+    async def fetch(session, url):
+        try:
+            async with session.get(f"https://r.jina.ai/{url}") as response:
+                if response.status != 200:
+                    return f"Error fetching webpage: Failed to fetch: {response.status}"
+
+                # Stop reading once there is more than we would keep
+                decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+                chunks = []
+                total = 0
+                async for chunk in response.content.iter_chunked(4096):
+                    text = decoder.decode(chunk)
+                    chunks.append(text)
+                    total += len(text)
+                    if total > MAX_CONTENT_CHARS:
+                        break
+                return _truncate_content(''.join(chunks).strip())
+        except asyncio.TimeoutError:
+            return "Error: Timeout while fetching webpage"
+        except Exception as e:
+            return f"Error fetching webpage: {str(e)}"
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        contents = await asyncio.gather(*(fetch(session, url) for url in urls))
+    return dict(zip(urls, contents))
+
+
+def ensure_memory_table_exists() -> str:
+    """
+    Check if the memory table (and its hashtag index table) exists, create it if it doesn't.
     
-    except ClientError as e:
-        if e.response['Error']['Code'] == 'ResourceNotFoundException':
-            # Table doesn't exist, create it
-            try:
-                dynamodb_client.create_table(
-                    TableName=MEMORY_TABLE_NAME,
-                    KeySchema=[
-                        {'AttributeName': 'memory_id', 'KeyType': 'HASH'},
-                    ],
-                    AttributeDefinitions=[
-                        {'AttributeName': 'memory_id', 'AttributeType': 'S'},
-                    ],
-                    BillingMode='PAY_PER_REQUEST'  # On-demand pricing
-                )
-                
-                # Wait for table to be created
-                waiter = dynamodb_client.get_waiter('table_exists')
-                waiter.wait(TableName=MEMORY_TABLE_NAME)
-                
-                logger.info(f"Created memory table: {MEMORY_TABLE_NAME}")
-                return f"Successfully created memory table '{MEMORY_TABLE_NAME}'"
-            
-            except Exception as create_error:
-                return f"Error creating table: {str(create_error)}"
-        else:
-            return f"Error checking table: {e.response['Error']['Message']}"
+    Returns:
+        Status message
+    """
+    global _TABLE_READY
+    if _TABLE_READY:
+        return f"Memory tables '{MEMORY_TABLE_NAME}' and '{HASHTAG_TABLE_NAME}' are ready (cached)"
+
+    memory_ready, memory_status = _ensure_table(
+        MEMORY_TABLE_NAME,
+        key_schema=[
+            {'AttributeName': 'memory_id', 'KeyType': 'HASH'},
+        ],
+        attribute_definitions=[
+            {'AttributeName': 'memory_id', 'AttributeType': 'S'},
+            {'AttributeName': 'pk', 'AttributeType': 'S'},
+            {'AttributeName': 'timestamp', 'AttributeType': 'N'},
+        ],
+        global_secondary_indexes=[
+            {
+                'IndexName': RECENT_INDEX_NAME,
+                'KeySchema': [
+                    {'AttributeName': 'pk', 'KeyType': 'HASH'},
+                    {'AttributeName': 'timestamp', 'KeyType': 'RANGE'},
+                ],
+                'Projection': {'ProjectionType': 'ALL'},
+            }
+        ]
+    )
+    hashtag_ready, hashtag_status = _ensure_table(
+        HASHTAG_TABLE_NAME,
+        key_schema=[
+            {'AttributeName': 'hashtag', 'KeyType': 'HASH'},
+            {'AttributeName': 'memory_id', 'KeyType': 'RANGE'},
+        ],
+        attribute_definitions=[
+            {'AttributeName': 'hashtag', 'AttributeType': 'S'},
+            {'AttributeName': 'memory_id', 'AttributeType': 'S'},
+        ]
+    )
+    if memory_ready and hashtag_ready:
+        with _TABLE_LOCK:
+            _TABLE_READY = True
+    return f"{memory_status}\n{hashtag_status}"
 
 
-@tool
 def store_memory_item(
     content: str,
     tldr: str,
@@ -180,21 +305,19 @@ def store_memory_item(
     Returns:
         Success message with memory_id
     """
+    from botocore.exceptions import ClientError
+
     try:
-        table = dynamodb_resource.Table(MEMORY_TABLE_NAME)
-        
-        # Generate unique memory ID
         timestamp = datetime.utcnow()
-        memory_id = f"mem_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
         
         # Prepare item
         item = {
-            'memory_id': memory_id,
             'content': content,
             'tldr': tldr,
             'hashtags': hashtags,
             'created_at': timestamp.isoformat(),
-            'timestamp': int(timestamp.timestamp())
+            'timestamp': int(timestamp.timestamp()),
+            'pk': RECENT_INDEX_PK
         }
         
         if source_url:
@@ -203,8 +326,37 @@ def store_memory_item(
         if metadata:
             item['metadata'] = _convert_floats_to_decimal(metadata)
         
-        # Store in DynamoDB
-        table.put_item(Item=item)
+        normalized_hashtags = {_normalize_hashtag(tag) for tag in hashtags}
+        for attempt in range(1, MEMORY_ID_ATTEMPTS + 1):
+            # Random suffix keeps IDs unique when several memories are stored within the same second
+            memory_id = f"mem_{timestamp.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            item['memory_id'] = memory_id
+            
+            # Store the memory plus one index row per hashtag (so search_memories_by_hashtag
+            # can Query instead of Scan) in a single atomic round trip across both tables.
+            # The condition turns an ID collision into an error instead of a silent overwrite.
+            transact_items = [{'Put': {
+                'TableName': MEMORY_TABLE_NAME,
+                'Item': item,
+                'ConditionExpression': 'attribute_not_exists(memory_id)'
+            }}]
+            transact_items.extend(
+                {'Put': {'TableName': HASHTAG_TABLE_NAME, 'Item': {
+                    'hashtag': hashtag,
+                    'memory_id': memory_id,
+                    'tldr': tldr,
+                    'created_at': item['created_at']
+                }}}
+                for hashtag in normalized_hashtags
+            )
+            try:
+                # The resource's client accepts plain Python values, like Table.put_item
+                get_dynamodb()[1].meta.client.transact_write_items(TransactItems=transact_items)
+                break
+            except ClientError as e:
+                if attempt == MEMORY_ID_ATTEMPTS or not _is_condition_failure(e):
+                    raise
+                logger.warning(f"Memory ID {memory_id} already exists, generating a new one")
         
         logger.info(f"Stored memory: {memory_id}")
         return f"Successfully stored memory with ID: {memory_id}\nTLDR: {tldr}\nHashtags: {', '.join(hashtags)}"
@@ -213,7 +365,6 @@ def store_memory_item(
         return f"Error storing memory: {str(e)}"
 
 
-@tool
 def list_recent_memories(limit: int = 5) -> str:
     """
     List the most recent memories stored.
@@ -224,18 +375,33 @@ def list_recent_memories(limit: int = 5) -> str:
     Returns:
         List of recent memories
     """
+    from boto3.dynamodb.conditions import Key
+    from botocore.exceptions import ClientError
+
+    memory_table = get_table(MEMORY_TABLE_NAME)
     try:
-        table = dynamodb_resource.Table(MEMORY_TABLE_NAME)
-        
-        response = table.scan(Limit=limit)
-        items = response.get('Items', [])
+        try:
+            # Let DynamoDB return only the newest `limit` items
+            response = memory_table.query(
+                IndexName=RECENT_INDEX_NAME,
+                KeyConditionExpression=Key('pk').eq(RECENT_INDEX_PK),
+                ScanIndexForward=False,
+                Limit=limit,
+                **LISTING_PROJECTION
+            )
+            items = response.get('Items', [])
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ValidationException':
+                raise
+            # Table was created before RecentIndex existed: fall back to scanning
+            logger.warning(f"{RECENT_INDEX_NAME} not available on '{MEMORY_TABLE_NAME}', scanning instead")
+            items = memory_table.scan(**LISTING_PROJECTION).get('Items', [])
+            # Sort by timestamp (most recent first)
+            items.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
         
         if not items:
             return "No memories found"
         
-        # Sort by timestamp (most recent first)
-        items.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-        
         result = f"Recent memories ({len(items)}):\n\n"
         for i, item in enumerate(items[:limit], 1):
             result += f"{i}. [{item['memory_id']}]\n"
@@ -256,7 +422,6 @@ def list_recent_memories(limit: int = 5) -> str:
         return f"Error: {str(e)}"
 
 
-@tool
 def search_memories_by_hashtag(hashtag: str) -> str:
     """
     Search for memories containing a specific hashtag.
@@ -267,20 +432,19 @@ def search_memories_by_hashtag(hashtag: str) -> str:
     Returns:
         List of matching memories
     """
+    from boto3.dynamodb.conditions import Key
+
     try:
         # Normalize hashtag
-        if not hashtag.startswith('#'):
-            hashtag = f"#{hashtag}"
-        
-        table = dynamodb_resource.Table(MEMORY_TABLE_NAME)
-        response = table.scan()
-        items = response.get('Items', [])
+        hashtag = _normalize_hashtag(hashtag)
         
-        # Filter items with matching hashtag
-        matching_items = [
-            item for item in items 
-            if hashtag.lower() in [tag.lower() for tag in item.get('hashtags', [])]
-        ]
+        # memory_id sorts chronologically, so newest first is a descending Query
+        response = get_table(HASHTAG_TABLE_NAME).query(
+            KeyConditionExpression=Key('hashtag').eq(hashtag),
+            ProjectionExpression='memory_id, tldr, created_at',
+            ScanIndexForward=False
+        )
+        matching_items = response.get('Items', [])
         
         if not matching_items:
             return f"No memories found with hashtag: {hashtag}"
@@ -301,21 +465,113 @@ def search_memories_by_hashtag(hashtag: str) -> str:
 # Helper Functions
 # ============================================================================
 
+def _ensure_table(
+    table_name: str,
+    key_schema: list,
+    attribute_definitions: list,
+    global_secondary_indexes: list = None
+) -> tuple:
+    """Create an on-demand DynamoDB table if it doesn't exist.
+
+    Returns:
+        (ready, message): whether the table exists now, and a status message
+    """
+    from botocore.exceptions import ClientError
+
+    dynamodb_client = get_dynamodb()[0]
+    try:
+        # Check if table exists
+        dynamodb_client.describe_table(TableName=table_name)
+        return True, f"Table '{table_name}' already exists"
+    
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceNotFoundException':
+            # Table doesn't exist, create it
+            try:
+                create_kwargs = {}
+                if global_secondary_indexes:
+                    create_kwargs['GlobalSecondaryIndexes'] = global_secondary_indexes
+                
+                dynamodb_client.create_table(
+                    TableName=table_name,
+                    KeySchema=key_schema,
+                    AttributeDefinitions=attribute_definitions,
+                    BillingMode='PAY_PER_REQUEST',  # On-demand pricing
+                    **create_kwargs
+                )
+                
+                # Wait for table to be created
+                waiter = dynamodb_client.get_waiter('table_exists')
+                waiter.wait(TableName=table_name)
+                
+                logger.info(f"Created table: {table_name}")
+                return True, f"Successfully created table '{table_name}'"
+            
+            except Exception as create_error:
+                return False, f"Error creating table: {str(create_error)}"
+        else:
+            return False, f"Error checking table: {e.response['Error']['Message']}"
+
+
+def _is_condition_failure(error) -> bool:
+    """Return True if a write failed only because a ConditionExpression did not hold."""
+    code = error.response['Error']['Code']
+    if code == 'ConditionalCheckFailedException':
+        return True
+    if code == 'TransactionCanceledException':
+        reasons = error.response.get('CancellationReasons', [])
+        return any(reason.get('Code') == 'ConditionalCheckFailed' for reason in reasons)
+    return False
+
+
+def _is_fetch_error(text: str) -> bool:
+    """Check whether a fetch_webpage(s)_content result is an error message rather than page content."""
+    return text.startswith(("Error fetching webpage:", "Error: "))
+
+
+def _truncate_content(content: str) -> str:
+    """Cut fetched content down to MAX_CONTENT_CHARS, marking it as truncated."""
+    if len(content) > MAX_CONTENT_CHARS:
+        return content[:MAX_CONTENT_CHARS] + "\n\n[Content truncated...]"
+    return content
+
+
+def _normalize_hashtag(hashtag: str) -> str:
+    """Lower-case a hashtag and make sure it starts with '#'."""
+    hashtag = hashtag.strip().lower()
+    return hashtag if hashtag.startswith('#') else f"#{hashtag}"
+
+
 def _convert_floats_to_decimal(obj):
-    """Convert float values to Decimal for DynamoDB compatibility."""
+    """Convert float values to Decimal for DynamoDB compatibility (returns a converted copy)."""
     if isinstance(obj, float):
-        return Decimal(str(obj))
-    elif isinstance(obj, dict):
-        return {k: _convert_floats_to_decimal(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_convert_floats_to_decimal(item) for item in obj]
-    return obj
+        return Decimal(repr(obj))
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    # Walk nested dicts/lists with an explicit stack instead of recursing, copying each
+    # container once and replacing only the float leaves in place
+    root = dict(obj) if isinstance(obj, dict) else list(obj)
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        keys = container.keys() if isinstance(container, dict) else range(len(container))
+        for key in keys:
+            value = container[key]
+            if isinstance(value, float):
+                container[key] = Decimal(repr(value))
+            elif isinstance(value, dict):
+                container[key] = dict(value)
+                stack.append(container[key])
+            elif isinstance(value, list):
+                container[key] = list(value)
+                stack.append(container[key])
+    return root
 
 
 def extract_urls(text: str) -> list:
     """Extract URLs from text."""
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    return re.findall(url_pattern, text)
+    return _URL_RE.findall(text)
 
 
 def create_memory_prompt(user_input: str, webpage_content: str = None) -> str:
@@ -325,68 +581,128 @@ def create_memory_prompt(user_input: str, webpage_content: str = None) -> str:
     if webpage_content:
         prompt += f"Webpage content:\n{webpage_content}\n\n"
     
-    prompt += """Please process this information and:
-1. Create a concise TLDR (1-3 sentences)
-2. Generate 3-5 relevant hashtags (format: #hashtag)
-3. Store this as a memory item
-
-Use the tools available to:
-- First, ensure the memory table exists
-- Then, store the memory with appropriate metadata"""
+    prompt += """Summarize this information as a memory item.
+Call emit_memory_summary exactly once with:
+- tldr: a concise summary (1-3 sentences)
+- hashtags: 3-5 relevant hashtags (format: #hashtag)"""
     
     return prompt
 
 
+@lru_cache(maxsize=1)
+def get_summary_schema():
+    """
+    Build the schema the model must fill in to summarize a memory.
+
+    Agent.structured_output() turns it into a single forced tool call, so the
+    model returns only these fields instead of free-form text.
+    """
+    from pydantic import BaseModel, Field
+
+    # Strands names the forced tool after the class
+    class emit_memory_summary(BaseModel):
+        """Record the TLDR and hashtags for a memory item."""
+        # Limits are only described, not enforced: a slightly long answer would otherwise
+        # fail validation and nothing would be stored. main() trims the result instead.
+        tldr: str = Field(description=f"Concise summary in 1-3 sentences, at most {MAX_TLDR_CHARS} characters")
+        hashtags: list[str] = Field(description=f"3-{MAX_HASHTAGS} relevant hashtags, each starting with #")
+
+    return emit_memory_summary
+
+
+async def gather_memory_inputs(urls: list) -> tuple:
+    """
+    Fetch the given URLs while making sure the memory tables exist.
+
+    The two steps are independent, so they run concurrently.
+
+    Returns:
+        (table_status, pages): ensure_memory_table_exists() message and a dict of URL -> content
+    """
+    async def fetch_pages():
+        if len(urls) > 1:
+            return await fetch_webpages_content(urls)
+        if urls:
+            return {urls[0]: await fetch_webpage_content(urls[0])}
+        return {}
+
+    return await asyncio.gather(asyncio.to_thread(ensure_memory_table_exists), fetch_pages())
+
+
 # ============================================================================
 # Main Logic
 # ============================================================================
 
 def main(user_input):
     """Main function to process user input and store memories."""
+    from strands import Agent
     
-    # Initialize agent with tools
-    tools = [
-        fetch_webpage_content,
-        ensure_memory_table_exists,
-        store_memory_item,
-        list_recent_memories,
-        search_memories_by_hashtag
-    ]
+    # Check if input contains URLs
+    urls = extract_urls(user_input)
+    if urls:
+        logger.info(f"Detected URL(s): {urls}")
+    else:
+        logger.info("No URLs detected, storing direct input")
     
+    table_status, pages = asyncio.run(gather_memory_inputs(urls))
+    logger.info(table_status)
+    
+    # Never summarize and store an error message as if it were the page
+    for url, text in pages.items():
+        if _is_fetch_error(text):
+            logger.error(f"Skipping {url}: {text}")
+    pages = {url: text for url, text in pages.items() if not _is_fetch_error(text)}
+    if urls and not pages:
+        print("Nothing stored: none of the URLs could be fetched")
+        sys.exit(1)
+    fetched_urls = list(pages)
+    webpage_content = "\n\n".join(f"[{url}]\n{text}" for url, text in pages.items())
+    
+    # The model only has to summarize: one forced emit_memory_summary call
+    # instead of a multi-turn tool loop with free-form output
     agent = Agent(
         system_prompt=SYSTEM_PROMPT,
-        model=model,
-        tools=tools,
-        callback_handler=PrintingCallbackHandler()
+        model=get_model(),
+        callback_handler=None
     )
+    summary = agent.structured_output(get_summary_schema(), create_memory_prompt(user_input, webpage_content))
     
-    # Check if input contains URLs
-    urls = extract_urls(user_input)
-    
-    if urls:
-        logger.info(f"Detected URL(s): {urls}")
-        prompt = f"""The user wants to store this information: "{user_input}"
+    content = f"{user_input}\n\n{webpage_content}" if webpage_content else user_input
+    result = store_memory_item(
+        content=content,
+        tldr=summary.tldr[:MAX_TLDR_CHARS].rstrip(),
+        hashtags=summary.hashtags[:MAX_HASHTAGS],
+        source_url=fetched_urls[0] if fetched_urls else None,
+        metadata={'source_urls': fetched_urls} if len(fetched_urls) > 1 else None
+    )
+    print("\n" + "="*60)
+    print("RESULT:")
+    print("="*60)
+    print(result)
 
-I found a URL: {urls[0]}
 
-Please:
-1. Use fetch_webpage_content to retrieve the webpage
-2. Use ensure_memory_table_exists to make sure the table is ready
-3. Analyze the content and create a TLDR (1-3 sentences) and 3-5 hashtags
-4. Use store_memory_item to save everything
+def recall(question):
+    """Answer a question about stored memories with a tool-using agent."""
+    from strands import Agent, tool
+    from strands.handlers.callback_handler import PrintingCallbackHandler
+    from strands.tools.executors import ConcurrentToolExecutor
 
-The content should include the original user input and the webpage content."""
-    else:
-        logger.info("No URLs detected, storing direct input")
-        prompt = f"""The user wants to store this information: "{user_input}"
+    tools = [
+        tool(list_recent_memories),
+        tool(search_memories_by_hashtag),
+        tool(fetch_webpage_content),
+        tool(fetch_webpages_content)
+    ]
 
-Please:
-1. Use ensure_memory_table_exists to make sure the table is ready
-2. Create a TLDR (1-3 sentences) and 3-5 hashtags from the input
-3. Use store_memory_item to save the information"""
-    
-    # Run the agent
-    result = agent(prompt)
+    # Run independent tool calls from the same model turn in parallel
+    agent = Agent(
+        system_prompt=RECALL_SYSTEM_PROMPT,
+        model=get_model(),
+        tools=tools,
+        tool_executor=ConcurrentToolExecutor(),
+        callback_handler=PrintingCallbackHandler()
+    )
+    result = agent(question)
     print("\n" + "="*60)
     print("RESULT:")
     print("="*60)
@@ -402,12 +718,24 @@ def get_stdin():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Store memories in DynamoDB, or ask about them")
+    parser.add_argument(
+        '--recall',
+        action='store_true',
+        help='Treat the input as a question about stored memories instead of storing it'
+    )
+    args = parser.parse_args()
+
     user_input = get_stdin()
     if user_input:
-        main(user_input)
+        if args.recall:
+            recall(user_input)
+        else:
+            main(user_input)
     else:
         print("No input provided")
         print("\nUsage:")
         print('  echo "Store this web page: https://example.com" | python memory_agent.py')
         print('  echo "Remember that Python 3.12 was released in October 2023" | python memory_agent.py')
+        print('  echo "What did I save about #python recently?" | python memory_agent.py --recall')
         sys.exit(1)
@@ -3,14 +3,19 @@
 import logging
 import os
 import sys
+import threading
 from decimal import Decimal
+from functools import lru_cache
 
 import boto3
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeDeserializer
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from strands import Agent, tool
 from strands.handlers.callback_handler import PrintingCallbackHandler
 from strands.models.bedrock import BedrockModel
+from strands.tools.executors import ConcurrentToolExecutor
 from strands.tools.mcp.mcp_client import MCPClient
 
 # Set up logging
@@ -28,9 +33,18 @@ BEDROCK_REGION = os.getenv("BEDROCK_REGION", 'us-west-2')
 BEDROCK_MODEL_ID = "us.amazon.nova-lite-v1:0"
 DYNAMODB_REGION = os.getenv("DYNAMODB_REGION", BEDROCK_REGION)
 
-# Initialize AWS clients
-dynamodb_client = boto3.client('dynamodb', region_name=DYNAMODB_REGION)
-dynamodb_resource = boto3.resource('dynamodb', region_name=DYNAMODB_REGION)
+# Initialize AWS clients (keep-alive connections stay warm between tool calls)
+dynamodb_config = Config(
+    tcp_keepalive=True,
+    max_pool_connections=32,
+    retries=dict(max_attempts=5, mode="adaptive"),
+)
+dynamodb_client = boto3.client('dynamodb', region_name=DYNAMODB_REGION, config=dynamodb_config)
+# boto3 resources are not thread-safe and the agent runs tools on worker threads,
+# so each thread gets its own resource and Table objects (see _get_table)
+_THREAD_LOCAL = threading.local()
+# Turns low-level client attribute values ({'S': ...}) into the Python types the resource API returns
+_DESERIALIZER = TypeDeserializer()
 
 # Initialize Strands Agent
 model = BedrockModel(
@@ -179,16 +193,18 @@ def describe_dynamodb_table(table_name: str) -> str:
         response = dynamodb_client.describe_table(TableName=table_name)
         table = response['Table']
         
-        result = f"Table: {table['TableName']}\n"
-        result += f"Status: {table['TableStatus']}\n"
-        result += f"Item Count: {table.get('ItemCount', 'N/A')}\n"
-        result += f"Size: {table.get('TableSizeBytes', 0)} bytes\n"
-        result += f"Creation Time: {table.get('CreationDateTime', 'N/A')}\n"
-        result += "\nKey Schema:\n"
-        for key in table['KeySchema']:
-            result += f"  - {key['AttributeName']} ({key['KeyType']})\n"
+        parts = [
+            f"Table: {table['TableName']}",
+            f"Status: {table['TableStatus']}",
+            f"Item Count: {table.get('ItemCount', 'N/A')}",
+            f"Size: {table.get('TableSizeBytes', 0)} bytes",
+            f"Creation Time: {table.get('CreationDateTime', 'N/A')}",
+            "",
+            "Key Schema:",
+        ]
+        parts.extend(f"  - {key['AttributeName']} ({key['KeyType']})" for key in table['KeySchema'])
         
-        return result
+        return "\n".join(parts) + "\n"
     
     except ClientError as e:
         error_code = e.response['Error']['Code']
@@ -217,7 +233,7 @@ def put_dynamodb_item(table_name: str, item: dict) -> str:
         Success or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
+        table = _get_table(table_name)
         
         # Convert float to Decimal for DynamoDB compatibility
         item = _convert_floats_to_decimal(item)
@@ -232,6 +248,38 @@ def put_dynamodb_item(table_name: str, item: dict) -> str:
         return f"Unexpected error: {str(e)}"
 
 
+@tool
+def batch_put_dynamodb_items(table_name: str, items: list[dict]) -> str:
+    """
+    Create or update many items in a DynamoDB table at once.
+    Use this instead of repeated put_dynamodb_item calls when adding more than one item.
+    
+    Args:
+        table_name: Name of the table
+        items: List of item dictionaries (each must include the primary key)
+    
+    Returns:
+        Success or error message
+    """
+    try:
+        table = _get_table(table_name)
+        
+        # batch_writer sends BatchWriteItem requests of up to 25 items and retries unprocessed
+        # ones; de-duplicating on the primary key avoids a ValidationException for repeated keys
+        key_names = [key['AttributeName'] for key in table.key_schema]
+        with table.batch_writer(overwrite_by_pkeys=key_names) as batch:
+            for item in items:
+                batch.put_item(Item=_convert_floats_to_decimal(item))
+        
+        logger.info(f"{len(items)} item(s) added to table {table_name}")
+        return f"Successfully added/updated {len(items)} item(s) in table '{table_name}'"
+    
+    except ClientError as e:
+        return f"Error putting items: {e.response['Error']['Message']}"
+    except Exception as e:
+        return f"Unexpected error: {str(e)}"
+
+
 @tool
 def get_dynamodb_item(table_name: str, key: dict) -> str:
     """
@@ -245,12 +293,11 @@ def get_dynamodb_item(table_name: str, key: dict) -> str:
         Item data or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
+        table = _get_table(table_name)
         response = table.get_item(Key=key)
         
         if 'Item' in response:
-            item = _convert_decimal_to_float(response['Item'])
-            return f"Item found:\n{_format_item(item)}"
+            return f"Item found:\n{_format_item(response['Item'])}"
         else:
             return f"No item found with key: {key}"
     
@@ -278,14 +325,13 @@ def update_dynamodb_item(
         Success or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
+        table = _get_table(table_name)
         
         # Convert float to Decimal
         updates = _convert_floats_to_decimal(updates)
         
-        # Build update expression
-        update_expression = "SET " + ", ".join(f"#{k} = :{k}" for k in updates.keys())
-        expression_attribute_names = {f"#{k}": k for k in updates.keys()}
+        # Build update expression (the expression and names only depend on which attributes change)
+        update_expression, expression_attribute_names = _build_update_template(tuple(updates))
         expression_attribute_values = {f":{k}": v for k, v in updates.items()}
         
         table.update_item(
@@ -317,7 +363,7 @@ def delete_dynamodb_item(table_name: str, key: dict) -> str:
         Success or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
+        table = _get_table(table_name)
         table.delete_item(Key=key)
         logger.info(f"Item deleted from table {table_name}")
         return f"Successfully deleted item from table '{table_name}'"
@@ -328,11 +374,69 @@ def delete_dynamodb_item(table_name: str, key: dict) -> str:
         return f"Unexpected error: {str(e)}"
 
 
+@tool
+def transact_write_dynamodb(operations: list[dict]) -> str:
+    """
+    Apply several writes atomically: either all of them succeed or none do.
+    Use this when items must change together (e.g. a record and its audit entry).
+    
+    Args:
+        operations: Up to 100 operations, each one of:
+            {'table': 'users', 'put': {...item...}}
+            {'table': 'users', 'delete': {...key...}}
+            {'table': 'users', 'update': {'key': {...key...}, 'updates': {'status': 'active'}}}
+    
+    Returns:
+        Success or error message
+    """
+    try:
+        transact_items = []
+        for op in operations:
+            table_name = op['table']
+            if 'put' in op:
+                transact_items.append({'Put': {
+                    'TableName': table_name,
+                    'Item': _convert_floats_to_decimal(op['put'])
+                }})
+            elif 'delete' in op:
+                transact_items.append({'Delete': {
+                    'TableName': table_name,
+                    'Key': _convert_floats_to_decimal(op['delete'])
+                }})
+            elif 'update' in op:
+                updates = _convert_floats_to_decimal(op['update']['updates'])
+                update_expression, expression_attribute_names = _build_update_template(tuple(updates))
+                transact_items.append({'Update': {
+                    'TableName': table_name,
+                    'Key': _convert_floats_to_decimal(op['update']['key']),
+                    'UpdateExpression': update_expression,
+                    'ExpressionAttributeNames': expression_attribute_names,
+                    'ExpressionAttributeValues': {f":{k}": v for k, v in updates.items()}
+                }})
+            else:
+                return f"Error: operation must contain 'put', 'delete' or 'update': {op}"
+        
+        # The resource's client accepts plain Python values, like Table.put_item
+        _get_resource().meta.client.transact_write_items(TransactItems=transact_items)
+        logger.info(f"Transaction of {len(transact_items)} operation(s) committed")
+        return f"Successfully applied {len(transact_items)} operation(s) in one transaction"
+    
+    except ClientError as e:
+        message = e.response['Error']['Message']
+        reasons = [reason.get('Code') for reason in e.response.get('CancellationReasons', [])]
+        if reasons:
+            message += f" (per-operation results: {', '.join(str(code) for code in reasons)})"
+        return f"Error in transaction, no changes were made: {message}"
+    except Exception as e:
+        return f"Unexpected error: {str(e)}"
+
+
 @tool
 def scan_dynamodb_table(
     table_name: str,
     limit: int = 10,
-    filter_expression: str = None
+    filter_expression: str = None,
+    attributes: list[str] = None
 ) -> str:
     """
     Scan a DynamoDB table and return items (use sparingly, expensive operation).
@@ -341,29 +445,38 @@ def scan_dynamodb_table(
         table_name: Name of the table
         limit: Maximum number of items to return (default: 10)
         filter_expression: Optional filter expression (e.g., "attribute_exists(email)")
+        attributes: Optional list of attribute names to return (default: all attributes)
     
     Returns:
         List of items or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
-        
-        scan_kwargs = {'Limit': limit}
+        scan_kwargs = _projection_kwargs(attributes)
         if filter_expression:
             scan_kwargs['FilterExpression'] = filter_expression
         
-        response = table.scan(**scan_kwargs)
-        items = response.get('Items', [])
+        # A single Scan stops at 1MB (and Limit counts items before filtering), so follow
+        # LastEvaluatedKey until `limit` matching items have been collected
+        pagination = {'MaxItems': limit}
+        if not filter_expression:
+            # Without a filter every item read is returned, so small pages waste nothing;
+            # with one, keep DynamoDB's 1MB pages so a selective filter needs few calls
+            pagination['PageSize'] = min(limit, 1000)
+        pages = dynamodb_client.get_paginator('scan').paginate(
+            TableName=table_name,
+            PaginationConfig=pagination,
+            **scan_kwargs
+        )
+        items = [
+            {k: _DESERIALIZER.deserialize(v) for k, v in raw_item.items()}
+            for page in pages
+            for raw_item in page.get('Items', [])
+        ]
         
         if not items:
             return f"No items found in table '{table_name}'"
         
-        items = [_convert_decimal_to_float(item) for item in items]
-        result = f"Found {len(items)} item(s) in '{table_name}':\n\n"
-        for i, item in enumerate(items, 1):
-            result += f"Item {i}:\n{_format_item(item)}\n\n"
-        
-        return result.strip()
+        return _format_items(f"Found {len(items)} item(s) in '{table_name}':", items)
     
     except ClientError as e:
         return f"Error scanning table: {e.response['Error']['Message']}"
@@ -376,7 +489,8 @@ def query_dynamodb_table(
     table_name: str,
     partition_key_name: str,
     partition_key_value: str,
-    limit: int = 10
+    limit: int = 10,
+    attributes: list[str] = None
 ) -> str:
     """
     Query a DynamoDB table by partition key.
@@ -386,18 +500,18 @@ def query_dynamodb_table(
         partition_key_name: Name of the partition key attribute
         partition_key_value: Value to query for
         limit: Maximum number of items to return (default: 10)
+        attributes: Optional list of attribute names to return (default: all attributes)
     
     Returns:
         List of items or error message
     """
     try:
-        table = dynamodb_resource.Table(table_name)
-        
-        from boto3.dynamodb.conditions import Key
+        table = _get_table(table_name)
         
         response = table.query(
             KeyConditionExpression=Key(partition_key_name).eq(partition_key_value),
-            Limit=limit
+            Limit=limit,
+            **_projection_kwargs(attributes)
         )
         
         items = response.get('Items', [])
@@ -405,12 +519,7 @@ def query_dynamodb_table(
         if not items:
             return f"No items found with {partition_key_name} = '{partition_key_value}'"
         
-        items = [_convert_decimal_to_float(item) for item in items]
-        result = f"Found {len(items)} item(s):\n\n"
-        for i, item in enumerate(items, 1):
-            result += f"Item {i}:\n{_format_item(item)}\n\n"
-        
-        return result.strip()
+        return _format_items(f"Found {len(items)} item(s):", items)
     
     except ClientError as e:
         return f"Error querying table: {e.response['Error']['Message']}"
@@ -422,34 +531,150 @@ def query_dynamodb_table(
 # Helper Functions
 # ============================================================================
 
+def _get_resource():
+    """Return the DynamoDB resource for the calling thread, creating it on first use."""
+    resource = getattr(_THREAD_LOCAL, 'resource', None)
+    if resource is None:
+        # A fresh session per thread: the default boto3 session isn't thread-safe either
+        session = boto3.session.Session()
+        resource = session.resource('dynamodb', region_name=DYNAMODB_REGION, config=dynamodb_config)
+        _THREAD_LOCAL.resource = resource
+        _THREAD_LOCAL.tables = {}
+    return resource
+
+
+def _get_table(table_name):
+    """Return the calling thread's Table resource for table_name, reusing it across tool calls."""
+    resource = _get_resource()
+    table = _THREAD_LOCAL.tables.get(table_name)
+    if table is None:
+        table = _THREAD_LOCAL.tables[table_name] = resource.Table(table_name)
+    return table
+
+
+def _projection_kwargs(attributes):
+    """
+    Build ProjectionExpression arguments so DynamoDB returns only the given attributes.
+
+    Attribute names go through #a0, #a1, ... placeholders, so reserved words
+    (e.g. 'name', 'status') and names with special characters work.
+
+    Returns:
+        dict: Keyword arguments for scan/query (empty if attributes is empty or None)
+    """
+    if not attributes:
+        return {}
+    return {
+        'ProjectionExpression': ", ".join(f"#a{i}" for i in range(len(attributes))),
+        'ExpressionAttributeNames': {f"#a{i}": name for i, name in enumerate(attributes)},
+    }
+
+
+@lru_cache(maxsize=256)
+def _build_update_template(keys):
+    """
+    Build the SET UpdateExpression and ExpressionAttributeNames for a set of attributes.
+
+    Args:
+        keys: Tuple of attribute names being updated
+
+    Returns:
+        (update_expression, expression_attribute_names); callers must not mutate the dict
+    """
+    update_expression = "SET " + ", ".join(f"#{k} = :{k}" for k in keys)
+    expression_attribute_names = {f"#{k}": k for k in keys}
+    return update_expression, expression_attribute_names
+
+
+# Values that are, or may contain, floats
+_NEEDS_DECIMAL_CONVERSION = (float, dict, list)
+
+
 def _convert_floats_to_decimal(obj):
     """Convert float values to Decimal for DynamoDB compatibility."""
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    elif isinstance(obj, dict):
+    # Tool arguments arrive as plain JSON types, so exact type() checks cover the common
+    # case; isinstance() below still handles subclasses such as OrderedDict
+    obj_type = type(obj)
+    if obj_type is str or obj_type is int or obj_type is bool or obj is None:
+        return obj
+    if obj_type is float or isinstance(obj, float):
+        return Decimal(repr(obj))
+    # A shallow scan finds flat containers with nothing to convert (the common case
+    # for key-value items), which are returned as-is instead of being copied
+    if obj_type is dict or isinstance(obj, dict):
+        if not any(isinstance(v, _NEEDS_DECIMAL_CONVERSION) for v in obj.values()):
+            return obj
         return {k: _convert_floats_to_decimal(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
+    if obj_type is list or isinstance(obj, list):
+        if not any(isinstance(v, _NEEDS_DECIMAL_CONVERSION) for v in obj):
+            return obj
         return [_convert_floats_to_decimal(item) for item in obj]
     return obj
 
 
-def _convert_decimal_to_float(obj):
-    """Convert Decimal values to float for display."""
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {k: _convert_decimal_to_float(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_convert_decimal_to_float(item) for item in obj]
-    return obj
+def _format_value(value, buf):
+    """Append repr() of a nested attribute value to buf, showing Decimals as floats."""
+    if isinstance(value, Decimal):
+        buf.append(repr(float(value)))
+    elif isinstance(value, dict):
+        buf.append("{")
+        for i, (k, v) in enumerate(value.items()):
+            if i:
+                buf.append(", ")
+            buf.append(f"{k!r}: ")
+            _format_value(v, buf)
+        buf.append("}")
+    elif isinstance(value, list):
+        buf.append("[")
+        for i, v in enumerate(value):
+            if i:
+                buf.append(", ")
+            _format_value(v, buf)
+        buf.append("]")
+    else:
+        buf.append(repr(value))
+
+
+def _format_converted(item, buf):
+    """
+    Append an item to buf as '  key: value' lines, converting Decimals to floats on the way.
+
+    Produces the same text as formatting a Decimal-to-float converted copy of the item,
+    without building that copy first.
+    """
+    for i, (key, value) in enumerate(item.items()):
+        if i:
+            buf.append("\n")
+        if isinstance(value, (dict, list)):
+            buf.append(f"  {key}: ")
+            _format_value(value, buf)
+        elif isinstance(value, Decimal):
+            buf.append(f"  {key}: {float(value)}")
+        else:
+            # Scalars (the common case) become a single f-string per attribute
+            buf.append(f"  {key}: {value}")
 
 
 def _format_item(item):
     """Format item dictionary for readable output."""
-    result = []
-    for key, value in item.items():
-        result.append(f"  {key}: {value}")
-    return "\n".join(result)
+    buf = []
+    _format_converted(item, buf)
+    return "".join(buf)
+
+
+def _format_items(header, items):
+    """
+    Format a list of items under a header, numbering them 'Item 1:', 'Item 2:', ...
+
+    Every item is converted and formatted into one list buffer that is joined
+    once at the end, so the cost is linear in the size of the output.
+    """
+    buf = [header, "\n\n"]
+    for i, item in enumerate(items, 1):
+        buf.append(f"Item {i}:\n")
+        _format_converted(item, buf)
+        buf.append("\n\n")
+    return "".join(buf).strip()
 
 
 # ============================================================================
@@ -465,9 +690,11 @@ tools = [
     describe_dynamodb_table,
     # Item operations
     put_dynamodb_item,
+    batch_put_dynamodb_items,
     get_dynamodb_item,
     update_dynamodb_item,
     delete_dynamodb_item,
+    transact_write_dynamodb,
     scan_dynamodb_table,
     query_dynamodb_table,
 ]
@@ -479,10 +706,13 @@ prompts = [
 ]
 
 def main(user_input):
+    # Strands runs these (synchronous) tools in worker threads, so with the concurrent
+    # executor several DynamoDB calls from one model turn are in flight at once
     aws_agent = Agent(
         system_prompt = SYSTEM_PROMPT,
         model = model,
         tools = tools,
+        tool_executor = ConcurrentToolExecutor(),
         callback_handler = PrintingCallbackHandler()
     )
     print(aws_agent(user_input))
@@ -2,7 +2,7 @@
 
 """
 Installaiton:
-    uv pip install duckduckgo_search exa-py tavily-python
+    uv pip install duckduckgo_search exa-py tavily-python cachetools
 Usage:
     echo "Tell me about search engines" | strands_websearch.py --engine duckduckgo
 """
@@ -11,11 +11,12 @@ import argparse
 import logging
 import os
 import sys
+import threading
 
-from botocore.config import Config
+from cachetools import TTLCache, cached
+from concurrent.futures import ThreadPoolExecutor
 from strands import Agent, tool
 from strands.handlers.callback_handler import PrintingCallbackHandler
-from strands.models.bedrock import BedrockModel
 
 # Set up logging
 logging.basicConfig(
@@ -31,6 +32,15 @@ HOME = os.getenv('HOME')
 BEDROCK_REGION = os.getenv("BEDROCK_REGION", 'us-west-2')
 BEDROCK_MODEL_ID = "us.amazon.nova-lite-v1:0"
 
+# Repeated searches within a session (across turns or parallel tool calls) are answered
+# from memory, keyed by (engine, query, max_results)
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=900)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+def _search_cache_key(engine):
+    """Build a cache key function for one engine that ignores positional/keyword differences."""
+    return lambda query, max_results=3: (engine, query, max_results)
+
 # ----- Tavily Search -----
 TAVILY_API_KEY = os.getenv('TAVILY_API_KEY', None)
 TAVILY_SYSTEM_PROMPT = """
@@ -74,6 +84,7 @@ When displaying responses:
 """
 
 @tool
+@cached(_SEARCH_CACHE, key=_search_cache_key('tavily'), lock=_SEARCH_CACHE_LOCK)
 def tavily_search(query: str, max_results: int = 3):
     """
     Perform an internet search with the specified query using Tavily API
@@ -94,9 +105,11 @@ def tavily_search(query: str, max_results: int = 3):
         )
     except ImportError:
         logger.error("Tavily is not installed. Please install it using 'pip install tavily-python'.")
-        return None
+        # Raised rather than returning None, which @cached would keep for the TTL
+        raise ImportError("Tavily is not installed. Please install it using 'pip install tavily-python'.")
 
 @tool
+@cached(_SEARCH_CACHE, key=_search_cache_key('exa'), lock=_SEARCH_CACHE_LOCK)
 def exa_search(query: str, max_results: int = 3):
     """
     Perform an internet search with the specified query using Exa API
@@ -119,9 +132,10 @@ def exa_search(query: str, max_results: int = 3):
         )
     except ImportError:
         logger.error("Exa is not installed. Please install it using 'pip install exa-py'.")
-        return None
+        raise ImportError("Exa is not installed. Please install it using 'pip install exa-py'.")
 
 @tool
+@cached(_SEARCH_CACHE, key=_search_cache_key('duckduckgo'), lock=_SEARCH_CACHE_LOCK)
 def duckduckgo_search(query: str, max_results: int = 3):
     """
     Perform an internet search with the specified query using Duck Duck Go
@@ -143,19 +157,76 @@ def duckduckgo_search(query: str, max_results: int = 3):
         return response
     except ImportError:
         logger.error("Duck Duck Go is not installed. Please install it using 'pip install duckduckgo-search'.")
-        return None
-
-# Initialize Strands Agent
-model = BedrockModel(
-    model_id = BEDROCK_MODEL_ID,
-    max_tokens = 2048,
-    boto_client_config = Config(
-        read_timeout = 120,
-        connect_timeout = 120,
-        retries = dict(max_attempts=3, mode="adaptive"),
-    ),
-    temperature = 0.1
-)
+        raise ImportError("Duck Duck Go is not installed. Please install it using 'pip install duckduckgo-search'.")
+
+SEARCH_FUNCTIONS = {
+    'exa': exa_search,
+    'tavily': tavily_search,
+    'duckduckgo': duckduckgo_search,
+}
+MAX_SEARCH_WORKERS = 8
+
+def make_multi_search(engine: str):
+    """
+    Build the multi_search tool for one engine.
+
+    The engine is fixed here rather than left to the model, so it can only use
+    the engine whose API key main() has checked.
+
+    Args:
+        engine: Search engine to use (exa, tavily or duckduckgo)
+
+    Returns:
+        The multi_search tool, bound to engine
+    """
+    search = SEARCH_FUNCTIONS[engine]
+
+    def search_one(query, max_results):
+        # One failing query shouldn't discard the results of the others
+        try:
+            return search(query, max_results=max_results)
+        except Exception as e:
+            logger.error(f"Error searching {engine} for {query!r}: {e}")
+            return f"Error searching for {query!r}: {e}"
+
+    @tool
+    def multi_search(queries: list[str], max_results: int = 3):
+        """
+        Perform several internet searches at once. Use this instead of repeated
+        single searches when there is more than one query.
+        
+        Args:
+            queries: Questions or search phrases to search for
+            max_results: Maximum number of search results per query (default: 3)
+            
+        Returns:
+            Dictionary mapping each query to its search results or an error message
+        """
+        if not queries:
+            return {}
+
+        # The engine clients are blocking HTTP libraries, so run the queries in threads
+        with ThreadPoolExecutor(max_workers=min(MAX_SEARCH_WORKERS, len(queries))) as executor:
+            results = list(executor.map(lambda query: search_one(query, max_results), queries))
+        return dict(zip(queries, results))
+
+    return multi_search
+
+def get_model():
+    """Create the Bedrock model (imports botocore and the Bedrock provider on first use)."""
+    from botocore.config import Config
+    from strands.models.bedrock import BedrockModel
+
+    return BedrockModel(
+        model_id = BEDROCK_MODEL_ID,
+        max_tokens = 2048,
+        boto_client_config = Config(
+            read_timeout = 120,
+            connect_timeout = 120,
+            retries = dict(max_attempts=3, mode="adaptive"),
+        ),
+        temperature = 0.1
+    )
 
 def main(user_input, engine):
 
@@ -164,23 +235,26 @@ def main(user_input, engine):
             logger.error("Please set the EXA_API_KEY environment variable.")
             raise
         SYSTEM_PROMPT = EXA_SYSTEM_PROMPT
-        tools = [exa_search]
+        tools = [exa_search, make_multi_search(engine)]
     elif engine == 'tavily':
         if TAVILY_API_KEY is None:
             logger.error("Please set the TAVILY_API_KEY environment variable.")
             raise
         SYSTEM_PROMPT = TAVILY_SYSTEM_PROMPT
-        tools = [tavily_search]
+        tools = [tavily_search, make_multi_search(engine)]
     elif engine == 'duckduckgo':
         SYSTEM_PROMPT = DUCKDUCKGO_SYSTEM_PROMPT
-        tools = [duckduckgo_search]
+        tools = [duckduckgo_search, make_multi_search(engine)]
     else:
         logger.error(f"Unknown engine: {engine}")
         return
 
+    SYSTEM_PROMPT += "\nFor several queries, call multi_search once with all of them.\n"
+
+    # Only build the model once the engine and its API key have been validated
     agent = Agent(
         system_prompt = SYSTEM_PROMPT,
-        model = model,
+        model = get_model(),
         tools = tools,
         callback_handler = PrintingCallbackHandler()
     )
@@ -3,25 +3,35 @@
 """
 Usage:
   echo "https://aws.amazon.com/" | web2markdown.py
+  cat urls.txt | web2markdown.py   # one URL per line, fetched concurrently
   echo "https://aws.amazon.com/" | web2markdown.py --engine jina
   echo "https://aws.amazon.com/" | web2markdown.py --engine firecrawl
   echo "https://aws.amazon.com/" | web2markdown.py --engine playwright
+  cat urls.txt | web2markdown.py --engine playwright   # one URL per line, rendered concurrently
   echo "https://aws.amazon.com/" | web2markdown.py --engine textfromwebsite
 
 Installation:
-  uv pip install html2text
+  uv pip install html2text cachetools
+  uv pip install html-to-markdown   # optional, faster HTML to markdown conversion
+  uv pip install httpx h2   # optional, for concurrent multi-URL html2text
   playwright install
 """
 
 import argparse
+import asyncio
+import atexit
 import logging
 import os
 import requests
 import sys
-import time
+import threading
 
-from playwright.sync_api import sync_playwright
-from html2text import HTML2Text
+from cachetools import TTLCache, cached
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# playwright and html2text are imported inside the functions that use them, so
+# engines that need neither (e.g. jina) start without paying for them
 
 
 logging.basicConfig(
@@ -35,33 +45,218 @@ logger.setLevel(logging.INFO)
 
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY", '')
 
+# Shared HTTP session: keep-alive connections are reused across URLs instead of a new
+# TCP+TLS handshake per request, and transient failures are retried with backoff
+_HTTP = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                            max_retries=Retry(total=3, backoff_factor=0.3))
+_HTTP.mount('https://', _HTTP_ADAPTER)
+_HTTP.mount('http://', _HTTP_ADAPTER)
+
+# Converted pages by (engine, url), so re-fetching the same URL within 10 minutes is free
+_URL_CACHE = TTLCache(maxsize=256, ttl=600)
+_URL_CACHE_LOCK = threading.Lock()
+
+# Scroll to the bottom; returns the page height before scrolling and the time of the scroll
+SCROLL_TO_BOTTOM_JS = """() => {
+    const height = document.body.scrollHeight;
+    window.scrollTo(0, height);
+    return [height, performance.now()];
+}"""
+# The page has settled once lazy-loaded content made it taller, or once no resource
+# has finished loading for quietMs since the scroll (static pages take ~quietMs).
+# wait_time only bounds the worst case.
+PAGE_SETTLED_JS = """([height, scrolledAt, quietMs]) => {
+    if (document.body.scrollHeight > height) return true;
+    let last = scrolledAt;
+    for (const entry of performance.getEntriesByType('resource')) {
+        last = Math.max(last, entry.responseEnd);
+    }
+    return performance.now() - last >= quietMs;
+}"""
+SETTLE_QUIET_MS = 500
+
+
+class BrowserPool:
+    """
+    One headless Chromium kept open for the life of the process.
+
+    Launching Chromium takes several hundred milliseconds, so converting many
+    URLs should open a new page per URL rather than a new browser.
+    """
+
+    def __init__(self):
+        self._pw = None
+        self._browser = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        """Start Playwright and launch the browser if not already running."""
+        if self._browser is None:
+            from playwright.sync_api import sync_playwright
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=True)
+
+    @property
+    def browser(self):
+        """The shared browser, launched on first use."""
+        self.start()
+        return self._browser
+
+    def close(self):
+        """Close the browser and stop Playwright."""
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+
+_POOL = BrowserPool()
+atexit.register(_POOL.close)
+
+
+def _html_to_markdown(html: str, body_width: int = 78) -> str:
+    """
+    Convert an HTML string to markdown.
+
+    Uses the Rust-backed html-to-markdown package when it is installed, which is
+    much faster than html2text on large pages, and html2text otherwise.
+
+    Args:
+        html: The HTML to convert
+        body_width: html2text line wrap width (0 disables wrapping); html-to-markdown does not wrap
+    """
+    try:
+        from html_to_markdown import convert_to_markdown
+    except ImportError:
+        from html2text import HTML2Text
+        h = HTML2Text()
+        h.ignore_links = False
+        h.ignore_images = False
+        h.body_width = body_width
+        return h.handle(html)
+    return convert_to_markdown(html)
+
 
+@cached(_URL_CACHE, key=lambda url: ('html2text', url), lock=_URL_CACHE_LOCK)
 def html_to_text(url: str) -> str:
+    # Error pages raise instead of being converted, so they never reach _URL_CACHE
+    try:
+        from html_to_markdown import convert_to_markdown
+    except ImportError:
+        convert_to_markdown = None  # Fall back to html2text
+    if convert_to_markdown is not None:
+        response = _HTTP.get(url, timeout=30)
+        response.raise_for_status()
+        return convert_to_markdown(response.text)
+
     try:
         import html2text
         h = html2text.HTML2Text()
         h.ignore_links = False
-        html = requests.get(url).text
-        return h.handle(html)
+        # Feed the page to the parser as it arrives instead of decoding it into one
+        # large string first (same steps as HTML2Text.handle)
+        with _HTTP.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            for chunk in response.iter_content(chunk_size=1 << 16, decode_unicode=True):
+                h.feed(chunk)
+        h.feed("")
+        return h.optwrap(h.finish())
     except ImportError:
-        raise "Please install html2text using 'pip install html2text'"
+        raise ImportError("Please install html2text using 'pip install html2text'")
 
 
-def jina_to_markdown(url: str) -> str:
+async def html_to_text_many(urls: list) -> list:
+    """
+    Fetch several URLs concurrently and convert each page to markdown.
+
+    Args:
+        urls: URLs to fetch
+
+    Returns:
+        Text for each URL, in input order; a URL that fails to fetch yields an
+        error message instead, so the other results are still returned
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("Please install httpx using 'pip install httpx'")
+
+    # Pages converted recently (here or by html_to_text) are served from the cache
+    with _URL_CACHE_LOCK:
+        results = {url: _URL_CACHE.get(('html2text', url)) for url in urls}
+    misses = [url for url, text in results.items() if text is None]
+    if not misses:
+        return [results[url] for url in urls]
+
+    # Multiplex the requests over shared HTTP/2 connections when h2 is installed
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    async def fetch(client, url):
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return f"Error fetching {url}: {e}"
+        text = _html_to_markdown(response.text)
+        with _URL_CACHE_LOCK:
+            _URL_CACHE[('html2text', url)] = text
+        return text
+
+    async with httpx.AsyncClient(http2=http2, timeout=30, follow_redirects=True,
+                                 limits=httpx.Limits(max_connections=32)) as client:
+        texts = await asyncio.gather(*(fetch(client, url) for url in misses))
+
+    results.update(zip(misses, texts))
+    return [results[url] for url in urls]
+
+
+def jina_to_markdown(url: str, timeout: int = None, max_chars: int = None) -> str:
     """
     Use Jina AI's web scraper to convert web content to markdown.
+
+    If max_chars is given, the response is streamed and reading stops once
+    more than max_chars characters have arrived, so large pages are never
+    held in memory in full. Callers should truncate the result themselves.
     """
     try:
-        response = requests.get(f"https://r.jina.ai/{url}")    
-        if response.status_code == 200:
-            return response.text
-        else:
-            raise Exception(f"Failed to fetch: {response.status_code}")
+        with _HTTP.get(f"https://r.jina.ai/{url}", timeout=timeout, stream=max_chars is not None) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch: {response.status_code}")
+            if max_chars is None:
+                return response.text
+
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=4096, decode_unicode=True):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total > max_chars:
+                    break
+            return ''.join(chunks)
     except Exception as e:
         logger.error(f"Error using Jina AI: {e}")
         raise
 
 
+@cached(_URL_CACHE, key=lambda url, api_key=FIRECRAWL_API_KEY: ('firecrawl', url), lock=_URL_CACHE_LOCK)
 def firecrawl_to_markdown(url, api_key = FIRECRAWL_API_KEY) -> str:
     """
     Use Firecrawl API for professional-grade scraping.
@@ -84,46 +279,82 @@ def playwright_to_markdown(url: str, wait_time: int = 2):
     Use Playwright to render JavaScript and convert to markdown.
     Perfect for SPAs, React apps, and dynamic content.
     """
-    with sync_playwright() as p:
-        # Launch browser (use headless=False to see what's happening)
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    page = _POOL.browser.new_page()
+    try:
         # Navigate to the URL
         print(f"Loading {url}...")
         page.goto(url, wait_until="networkidle")
         
-        # Wait for dynamic content to load
-        time.sleep(wait_time)
-        
-        # Optional: Scroll to load lazy-loaded content
-        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        time.sleep(1)
+        # Scroll to load lazy-loaded content, waiting up to wait_time for it to arrive
+        height, scrolled_at = page.evaluate(SCROLL_TO_BOTTOM_JS)
+        try:
+            page.wait_for_function(PAGE_SETTLED_JS, arg=[height, scrolled_at, SETTLE_QUIET_MS],
+                                   timeout=wait_time * 1000)
+        except PlaywrightTimeoutError:
+            pass
         
         # Get the fully rendered HTML
         html = page.content()
-        
-        browser.close()
-        
-        # Convert HTML to markdown
-        h = HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = False
-        h.body_width = 0
-        
-        markdown = h.handle(html)
-        
-        return markdown
+    finally:
+        page.close()
+    
+    # Convert HTML to markdown
+    return _html_to_markdown(html, body_width=0)
+
+
+async def _render_markdown_async(browser, url: str, wait_time: int) -> str:
+    """Render one URL in a new page of an async Playwright browser and convert it to markdown."""
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    page = await browser.new_page()
+    try:
+        logger.info(f"Loading {url}...")
+        await page.goto(url, wait_until="networkidle")
+        height, scrolled_at = await page.evaluate(SCROLL_TO_BOTTOM_JS)
+        try:
+            await page.wait_for_function(PAGE_SETTLED_JS, arg=[height, scrolled_at, SETTLE_QUIET_MS],
+                                         timeout=wait_time * 1000)
+        except PlaywrightTimeoutError:
+            pass
+        html = await page.content()
+    finally:
+        await page.close()
+    
+    return _html_to_markdown(html, body_width=0)
+
+
+async def playwright_to_markdown_async(urls: list, wait_time: int = 2) -> list:
+    """
+    Render several URLs concurrently in one browser and convert each to markdown.
+
+    Pages load in parallel, so the total time is close to that of the slowest
+    page rather than the sum of all of them.
+
+    Args:
+        urls: URLs to render
+        wait_time: Seconds to wait for dynamic content after the page loads
+
+    Returns:
+        Markdown for each URL, in input order
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await asyncio.gather(*(_render_markdown_async(browser, url, wait_time) for url in urls))
+        finally:
+            await browser.close()
 
 
 def playwright_with_interactions(url: str, selector: str = ".article-content", timeout: int = 5000):
     """
     Advanced example: Click buttons, fill forms, etc.
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        
+    page = _POOL.browser.new_page()
+    try:
         page.goto(url)
         
         # Example: Click "Load More" button if it exists
@@ -142,14 +373,11 @@ def playwright_with_interactions(url: str, selector: str = ".article-content", t
             print("Timeout waiting for content")
         
         html = page.content()
-        browser.close()
-        
-        # Convert to markdown
-        h = HTML2Text()
-        h.ignore_links = False
-        markdown = h.handle(html)
-        
-        return markdown
+    finally:
+        page.close()
+    
+    # Convert to markdown
+    return _html_to_markdown(html)
 
 
 def download_url_content(url: str) -> str:
@@ -157,7 +385,7 @@ def download_url_content(url: str) -> str:
     Downloads content from a URL and returns it as a string
     """
     try:
-        response = requests.get(url)
+        response = _HTTP.get(url, timeout=30)
         response.raise_for_status() # Raise exception for bad status codes
         return response.text
     except requests.exceptions.RequestException as e:
@@ -165,6 +393,7 @@ def download_url_content(url: str) -> str:
         raise
 
 
+@cached(_URL_CACHE, key=lambda url: ('textfromwebsite', url), lock=_URL_CACHE_LOCK)
 def text_from_website(url: str) -> str:
     """
     Args:
@@ -181,13 +410,23 @@ def text_from_website(url: str) -> str:
 
 def main(user_input, engine):
     if engine == 'html2text':
-        print(html_to_text(user_input))
+        urls = user_input.split()
+        if len(urls) > 1:
+            # One URL per line: fetch them all concurrently
+            print("\n\n".join(asyncio.run(html_to_text_many(urls))))
+        else:
+            print(html_to_text(user_input))
     elif engine == 'jina':
         print(jina_to_markdown(user_input))
     elif engine == 'firecrawl':
         print(firecrawl_to_markdown(user_input))
     elif engine == 'playwright':
-        print(playwright_to_markdown(user_input))
+        urls = user_input.split()
+        if len(urls) > 1:
+            # One URL per line: render them all concurrently
+            print("\n\n".join(asyncio.run(playwright_to_markdown_async(urls))))
+        else:
+            print(playwright_to_markdown(user_input))
     elif engine == 'textfromwebsite':
         print(text_from_website(user_input))
     else: